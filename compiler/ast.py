@@ -2,42 +2,98 @@ class ASTNode:
     """
     Class representing a node in the Abstract Syntax Tree.
     Each node represents an element of the source code, such as expressions, assignments, or function calls.
+    Nodes compare structurally, so trees can be checked with == without building to_dict() copies.
     """
 
+    # Fixed attribute layout: no per-node __dict__ and faster attribute access
+    __slots__ = ('type', 'value', 'name', 'left', 'right', 'operator', 'function_name', 'args',
+                 'condition', 'body', 'data', 'contract', 'tasks')
+
     def __init__(self, type, value=None, name=None, left=None, right=None, operator=None, function_name=None, args=None, condition=None, body=None, data=None, contract=None, tasks=None):
-        self.type = type            # Type of node, e.g., 'assignment', 'expression', 'function_call'
-        self.value = value          # Value associated with the node, e.g., a constant value
-        self.name = name            # Name for variable assignment
-        self.left = left            # Left child for expressions
-        self.right = right          # Right child for expressions
-        self.operator = operator    # Operator for binary operations, e.g., '+', '-'
-        self.function_name = function_name  # Name of the function called
-        self.args = args            # Arguments for function calls
-        self.condition = condition  # Condition for control flow constructs
-        self.body = body            # Body of statements for control flow
-        self.data = data            # Data for quantum operations
-        self.contract = contract    # Privacy contract information
-        self.tasks = tasks          # Parallel execution tasks
+        # Nodes are frozen once built (see __setattr__), so fields are written through object.__setattr__
+        init = object.__setattr__
+        init(self, 'type', type)            # Type of node, e.g., 'assignment', 'expression', 'function_call'
+        init(self, 'value', value)          # Value associated with the node, e.g., a constant value
+        init(self, 'name', name)            # Name for variable assignment
+        init(self, 'left', left)            # Left child for expressions
+        init(self, 'right', right)          # Right child for expressions
+        init(self, 'operator', operator)    # Operator for binary operations, e.g., '+', '-'
+        init(self, 'function_name', function_name)  # Name of the function called
+        # Sequences are stored as tuples so trees shared through the parse cache cannot be appended to
+        init(self, 'args', tuple(args) if isinstance(args, list) else args)  # Arguments for function calls
+        init(self, 'condition', condition)  # Condition for control flow constructs
+        init(self, 'body', tuple(body) if isinstance(body, list) else body)  # Body of statements for control flow
+        init(self, 'data', data)            # Data for quantum operations
+        init(self, 'contract', contract)    # Privacy contract information
+        init(self, 'tasks', tasks)          # Parallel execution tasks
+
+    def __setattr__(self, name, value):
+        # Nodes are hashed and shared through the parse cache, so a change would corrupt every holder
+        raise AttributeError(f"ASTNode is immutable; cannot set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"ASTNode is immutable; cannot delete {name!r}")
+
+    def __reduce__(self):
+        # Rebuild through __init__: the default slot restore goes through __setattr__, which refuses.
+        # __slots__ lists the fields in constructor order
+        return ASTNode, tuple(getattr(self, field) for field in _FIELDS)
 
     def __repr__(self):
         return f"ASTNode(type={self.type}, value={self.value}, name={self.name})"
 
+    def __eq__(self, other):
+        """
+        Structural equality, walked with an explicit stack so deep trees do not recurse.
+        """
+        if not isinstance(other, ASTNode):
+            return NotImplemented
+        pairs = [(self, other)]
+        while pairs:
+            left, right = pairs.pop()
+            if left is right:
+                continue
+            if isinstance(left, ASTNode) and isinstance(right, ASTNode):
+                pairs.extend((getattr(left, field), getattr(right, field)) for field in _FIELDS)
+            elif isinstance(left, tuple) and isinstance(right, tuple):
+                if len(left) != len(right):
+                    return False
+                pairs.extend(zip(left, right))
+            elif left != right:
+                return False
+        return True
+
+    def __hash__(self):
+        # Shallow on purpose: equal trees agree on these fields, and hashing stays O(1) in tree depth
+        return hash((self.type, self.name, self.operator, self.function_name, self.args))
+
     def to_dict(self):
         """
         Convert the AST node to a dictionary for easier serialization and debugging.
+        Walks the tree with an explicit stack so deep trees do not recurse.
         """
-        return {
-            "type": self.type,
-            "value": self.value,
-            "name": self.name,
-            "left": self.left.to_dict() if self.left else None,
-            "right": self.right.to_dict() if self.right else None,
-            "operator": self.operator,
-            "function_name": self.function_name,
-            "args": self.args,
-            "condition": self.condition,
-            "body": [n.to_dict() for n in self.body] if self.body else None,
-            "data": self.data,
-            "contract": self.contract,
-            "tasks": self.tasks
-        }
+        root = {}
+        stack = [(self, root)]
+        while stack:
+            node, out = stack.pop()
+            for field in _FIELDS:
+                out[field] = getattr(node, field)
+            for field in _CHILD_FIELDS:
+                child = out[field]
+                if child:
+                    out[field] = {}
+                    stack.append((child, out[field]))
+                else:
+                    out[field] = None
+            body = out["body"]
+            if body:
+                out["body"] = [{} for _ in body]
+                stack.extend(zip(body, out["body"]))
+            else:
+                out["body"] = None
+        return root
+
+
+# Field order matches the dictionary layout produced by ASTNode.to_dict
+_FIELDS = ASTNode.__slots__
+_CHILD_FIELDS = ("left", "right")
@@ -0,0 +1,62 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+# Bump when ASTNode's layout or the parser's output changes so stale trees are ignored
+AST_CACHE_VERSION = "v3"
+
+CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".sypher", "ast-cache")
+
+
+def cache_key(source):
+    """
+    Build the cache key for a piece of SypherLang source code.
+
+    :param source: The SypherLang source code as a string.
+    :return: Hex digest of the source suffixed with the cache version.
+    """
+    return f"{hashlib.sha256(source.encode('utf-8')).hexdigest()}-{AST_CACHE_VERSION}"
+
+
+def _cache_path(key):
+    return os.path.join(CACHE_DIRECTORY, key[:2], f"{key}.pkl")
+
+
+def load(key):
+    """
+    Load a cached AST.
+
+    :param key: Key produced by cache_key().
+    :return: The cached AST root, or None on a miss or unreadable entry.
+    """
+    try:
+        with open(_cache_path(key), 'rb') as cached:
+            return pickle.load(cached)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+
+def store(key, node):
+    """
+    Store an AST in the cache. Failures are ignored since the cache is only an optimization.
+
+    :param key: Key produced by cache_key().
+    :param node: The AST root to store.
+    """
+    path = _cache_path(key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partial pickle
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            pickle.dump(node, out, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
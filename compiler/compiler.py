@@ -1,10 +1,29 @@
 import os
 import sys
+from array import array
 from lexer import Lexer
 from parser import Parser
 from ast import ASTNode
+import ast_cache
 import json
 
+# Bytecode is kept as parallel columns: an array('B') of opcode IDs and a list of operands.
+# An opcode's ID is its index here; the operand fields name its entries in the JSON layout.
+OPCODE_NAMES = ('LOAD_CONST', 'STORE_NAME', 'BINARY_OP', 'CALL_FUNCTION', 'CONTROL_FLOW',
+                'QUANTUM_ENCRYPT', 'PRIVACY_CONTRACT', 'PARALLEL_EXEC')
+OPCODES = {name: code for code, name in enumerate(OPCODE_NAMES)}
+_OPERAND_FIELDS = (('value',), ('name',), ('operation',), ('name', 'args'), ('condition',),
+                   ('data',), ('contract',), ('tasks',))
+
+LOAD_CONST = OPCODES['LOAD_CONST']
+STORE_NAME = OPCODES['STORE_NAME']
+BINARY_OP = OPCODES['BINARY_OP']
+CALL_FUNCTION = OPCODES['CALL_FUNCTION']
+CONTROL_FLOW = OPCODES['CONTROL_FLOW']
+QUANTUM_ENCRYPT = OPCODES['QUANTUM_ENCRYPT']
+PRIVACY_CONTRACT = OPCODES['PRIVACY_CONTRACT']
+PARALLEL_EXEC = OPCODES['PARALLEL_EXEC']
+
 class Compiler:
     """
     Compiler for SypherLang that transforms .sypher source code into executable bytecode.
@@ -15,6 +34,16 @@ class Compiler:
         self.output_directory = "./bytecode/"
         if not os.path.exists(self.output_directory):
             os.makedirs(self.output_directory)
+        # Node type -> emitter; one dict lookup replaces a chain of string comparisons per node
+        self._emitters = {
+            'assignment': self._emit_assignment,
+            'expression': self._emit_expression,
+            'function_call': self._emit_function_call,
+            'control_flow': self._emit_control_flow,
+            'quantum_op': self._emit_quantum_op,
+            'privacy_contract': self._emit_privacy_contract,
+            'parallel_exec': self._emit_parallel_exec,
+        }
 
     def compile(self, input_file):
         """
@@ -28,13 +57,20 @@ class Compiler:
                 code = source_code.read()
                 print(f"[Compiler] Reading source code from {input_file}")
 
-            lexer = Lexer()
-            tokens = lexer.tokenize(code)
-            print(f"[Compiler] Tokens generated: {tokens}")
-
-            parser = Parser()
-            ast_root = parser.parse(tokens)
-            print(f"[Compiler] AST generated: {ast_root}")
+            # Unchanged sources skip lexing and parsing entirely
+            cache_key = ast_cache.cache_key(code)
+            ast_root = ast_cache.load(cache_key)
+            if ast_root is None:
+                lexer = Lexer()
+                tokens = lexer.tokenize(code)
+                print(f"[Compiler] Tokens generated: {tokens}")
+
+                parser = Parser()
+                ast_root = parser.parse(tokens)
+                ast_cache.store(cache_key, ast_root)
+                print(f"[Compiler] AST generated: {ast_root}")
+            else:
+                print(f"[Compiler] AST loaded from cache: {ast_root}")
 
             bytecode = self.generate_bytecode(ast_root)
             self.write_bytecode(input_file, bytecode)
@@ -49,70 +85,98 @@ class Compiler:
         Generate bytecode from the Abstract Syntax Tree (AST).
         
         :param ast_root: Root of the AST.
-        :return: A list representing bytecode.
+        :return: A tuple (opcodes, operands): an array('B') of opcode IDs and the matching list of operands.
         """
         print(f"[Compiler] Generating bytecode from AST...")
-        bytecode = []
+        bytecode = (array('B'), [])
         self.traverse_ast(ast_root, bytecode)
         return bytecode
 
+    @staticmethod
+    def to_legacy(bytecode):
+        """
+        Expand compact bytecode into the list-of-dicts layout used in .bytecode.json files.
+
+        :param bytecode: A tuple (opcodes, operands) from generate_bytecode.
+        :return: A list of instruction dictionaries.
+        """
+        instructions = []
+        for code, operand in zip(*bytecode):
+            fields = _OPERAND_FIELDS[code]
+            instruction = {'op': OPCODE_NAMES[code]}
+            instruction.update(zip(fields, (operand,) if len(fields) == 1 else operand))
+            instructions.append(instruction)
+        return instructions
+
     def traverse_ast(self, node, bytecode):
         """
         Traverse the AST to generate bytecode instructions.
         
         :param node: The current AST node.
-        :param bytecode: The list storing the generated bytecode.
+        :param bytecode: The (opcodes, operands) pair storing the generated bytecode.
         """
         if node is None:
             return
-
-        if node.type == 'assignment':
-            # Example: x = 5
-            bytecode.append({'op': 'LOAD_CONST', 'value': node.value})
-            bytecode.append({'op': 'STORE_NAME', 'name': node.name})
-
-        elif node.type == 'expression':
-            # Example: 5 + 2
-            self.traverse_ast(node.left, bytecode)
-            self.traverse_ast(node.right, bytecode)
-            bytecode.append({'op': 'BINARY_OP', 'operation': node.operator})
-
-        elif node.type == 'function_call':
-            # Example: encrypt(data)
-            bytecode.append({'op': 'CALL_FUNCTION', 'name': node.function_name, 'args': node.args})
-
-        elif node.type == 'control_flow':
-            # Example: if, while, for loops
-            bytecode.append({'op': 'CONTROL_FLOW', 'condition': node.condition})
-            for sub_node in node.body:
-                self.traverse_ast(sub_node, bytecode)
-
-        elif node.type == 'quantum_op':
-            # Example: Lattice-based encryption
-            bytecode.append({'op': 'QUANTUM_ENCRYPT', 'data': node.data})
-        
-        elif node.type == 'privacy_contract':
-            # Example: PrivacyContract (compile privacy-based smart contract logic)
-            bytecode.append({'op': 'PRIVACY_CONTRACT', 'contract': node.contract})
-        
-        elif node.type == 'parallel_exec':
-            # Example: Parallel execution of different functions
-            bytecode.append({'op': 'PARALLEL_EXEC', 'tasks': node.tasks})
+        emit = self._emitters.get(node.type)
+        if emit is not None:
+            emit(node, bytecode)
 
         print(f"[Compiler] Traversing node: {node.type}")
-        
+
+    def _emit_assignment(self, node, bytecode):  # x = 5
+        opcodes, operands = bytecode
+        opcodes.append(LOAD_CONST)
+        operands.append(node.value)
+        opcodes.append(STORE_NAME)
+        operands.append(node.name)
+
+    def _emit_expression(self, node, bytecode):  # 5 + 2
+        self.traverse_ast(node.left, bytecode)
+        self.traverse_ast(node.right, bytecode)
+        opcodes, operands = bytecode
+        opcodes.append(BINARY_OP)
+        operands.append(node.operator)
+
+    def _emit_function_call(self, node, bytecode):  # encrypt(data)
+        opcodes, operands = bytecode
+        opcodes.append(CALL_FUNCTION)
+        operands.append((node.function_name, list(node.args or ())))
+
+    def _emit_control_flow(self, node, bytecode):  # if, while, for loops
+        opcodes, operands = bytecode
+        opcodes.append(CONTROL_FLOW)
+        operands.append(node.condition)
+        for sub_node in node.body:
+            self.traverse_ast(sub_node, bytecode)
+
+    def _emit_quantum_op(self, node, bytecode):  # Lattice-based encryption
+        opcodes, operands = bytecode
+        opcodes.append(QUANTUM_ENCRYPT)
+        operands.append(node.data)
+
+    def _emit_privacy_contract(self, node, bytecode):  # Privacy-based smart contract logic
+        opcodes, operands = bytecode
+        opcodes.append(PRIVACY_CONTRACT)
+        operands.append(node.contract)
+
+    def _emit_parallel_exec(self, node, bytecode):  # Parallel execution of different functions
+        opcodes, operands = bytecode
+        opcodes.append(PARALLEL_EXEC)
+        operands.append(node.tasks)
+
+
     def write_bytecode(self, input_file, bytecode):
         """
         Write the generated bytecode to a file in the output directory.
         
         :param input_file: The input source file name.
-        :param bytecode: The bytecode to be written to the file.
+        :param bytecode: The (opcodes, operands) bytecode to be written to the file.
         """
         base_filename = os.path.basename(input_file)
         output_file = os.path.join(self.output_directory, f"{base_filename}.bytecode.json")
         
         with open(output_file, 'w') as out:
-            json.dump(bytecode, out, indent=4)
+            json.dump(self.to_legacy(bytecode), out, indent=4)
             print(f"[Compiler] Bytecode written to {output_file}")
 
 # Entry Point for the Compiler
@@ -1,5 +1,48 @@
+import functools
+import logging
 import re
 
+logger = logging.getLogger(__name__)
+
+# One alternation over every token class, so the whole scan runs inside the C regex engine.
+# A number must not run straight into an identifier (e.g. "9abc"); MISMATCH catches anything else.
+_TOKEN_REGEX = re.compile(r'''
+    (?P<WHITESPACE>\s+)
+  | (?P<NUMBER>[0-9]+(?![A-Za-z0-9_]))
+  | (?P<IDENTIFIER>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<OPERATOR>[-+*/=])
+  | (?P<DELIMITER>[{}(),;])
+  | (?P<STRING>"[^"]*")
+  | (?P<MISMATCH>.)
+''', re.VERBOSE | re.DOTALL)
+
+KEYWORDS = frozenset({'function', 'if', 'else', 'while', 'let', 'encrypt', 'prove_privacy', 'execute_parallel'})
+
+
+@functools.lru_cache(maxsize=512)
+def _scan(code, keywords):
+    """
+    Tokenize code against a keyword set. Pure, so repeated snippets are served from the cache.
+
+    :return: A tuple of (type, lexeme) tokens.
+    """
+    tokens = []
+    append = tokens.append
+    for match in _TOKEN_REGEX.finditer(code):
+        kind = match.lastgroup
+        if kind == 'WHITESPACE':
+            continue
+        lexeme = match.group()
+        if kind == 'IDENTIFIER':
+            # Keywords share the identifier pattern; a set lookup beats more alternation branches
+            if lexeme in keywords:
+                kind = 'KEYWORD'
+        elif kind == 'MISMATCH':
+            raise ValueError(f"Unknown token at position {match.start()}: {lexeme}")
+        append((kind, lexeme))
+    return tuple(tokens)
+
+
 class Lexer:
     """
     Lexer for SypherLang that converts source code into tokens.
@@ -7,39 +50,18 @@ class Lexer:
     """
 
     def __init__(self):
-        # Regular expressions for SypherLang tokens
-        self.token_patterns = [
-            ('KEYWORD', r'\b(function|if|else|while|let|encrypt|prove_privacy|execute_parallel)\b'),
-            ('IDENTIFIER', r'\b[a-zA-Z_][a-zA-Z0-9_]*\b'),
-            ('NUMBER', r'\b\d+\b'),
-            ('STRING', r'"[^"]*"'),
-            ('OPERATOR', r'[+\-*/=]'),
-            ('DELIMITER', r'[{}(),;]'),
-            ('WHITESPACE', r'\s+'),
-            ('UNKNOWN', r'.')
-        ]
+        self.keywords = KEYWORDS
 
     def tokenize(self, code):
         """
         Tokenize the input source code.
-        
+
         :param code: The SypherLang source code as a string.
-        :return: A list of tokens.
+        :return: A tuple of (type, lexeme) tokens.
         """
-        tokens = []
-        position = 0
-        while position < len(code):
-            for token_type, pattern in self.token_patterns:
-                regex = re.compile(pattern)
-                match = regex.match(code, position)
-                if match:
-                    lexeme = match.group(0)
-                    position = match.end()
-                    if token_type != 'WHITESPACE':
-                        tokens.append((token_type, lexeme))
-                    break
-            else:
-                raise ValueError(f"Unknown token at position {position}: {code[position]}")
-        
-        print(f"[Lexer] Tokenized source code into: {tokens}")
+        # Tuples are immutable, so the cached stream is handed out as-is
+        tokens = _scan(code, self.keywords)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[Lexer] Tokenized source code into: %r", tokens)
         return tokens
@@ -1,5 +1,34 @@
+import functools
 from ast import ASTNode
 
+# Fixed tokens the grammar expects verbatim; each check is a single tuple comparison
+_LET = ('KEYWORD', 'let')
+_FUNCTION = ('KEYWORD', 'function')
+_ASSIGN = ('OPERATOR', '=')
+_SEMICOLON = ('DELIMITER', ';')
+_COMMA = ('DELIMITER', ',')
+_LPAREN = ('DELIMITER', '(')
+_RPAREN = ('DELIMITER', ')')
+_LBRACE = ('DELIMITER', '{')
+_RBRACE = ('DELIMITER', '}')
+
+
+def _unexpected_token(expected_type, expected_value, token):
+    """
+    Build the error raised when a token does not match what the grammar expects.
+    """
+    token_type, token_value = token
+    return ValueError(f"Expected token {expected_type} '{expected_value}', got {token_type} '{token_value}'")
+
+@functools.lru_cache(maxsize=512)
+def _parse_tokens(tokens):
+    """
+    Parse a token tuple with a fresh parser. Parsing is pure, so repeated token streams hit the cache.
+    """
+    parser = Parser()
+    parser.tokens = tokens
+    return parser.program()
+
 class Parser:
     """
     Parser for SypherLang that converts a list of tokens into an Abstract Syntax Tree (AST).
@@ -15,11 +44,13 @@ class Parser:
         Parse the list of tokens to generate an AST.
         
         :param tokens: List of tokens to parse.
-        :return: Root of the generated AST.
+        :return: Root of the generated AST. Trees are immutable and shared between identical token streams.
         """
-        self.tokens = tokens
-        self.current_token_index = 0
-        return self.program()
+        # Tuples all the way down: the cache needs hashable keys and the grammar compares tokens to tuples
+        self.tokens = tuple(map(tuple, tokens))
+        root = _parse_tokens(self.tokens)
+        self.current_token_index = len(self.tokens)
+        return root
 
     def program(self):
         """
@@ -28,9 +59,11 @@ class Parser:
         :return: Root node of the AST representing the program.
         """
         nodes = []
-        while self.current_token_index < len(self.tokens):
-            nodes.append(self.statement())
-        return ASTNode(type='program', body=nodes)
+        statement = self.statement
+        token_count = len(self.tokens)
+        while self.current_token_index < token_count:
+            nodes.append(statement())
+        return ASTNode(type='program', body=tuple(nodes))
 
     def statement(self):
         """
@@ -38,10 +71,11 @@ class Parser:
         
         :return: AST node representing the statement.
         """
-        token_type, token_value = self.current_token()
-        if token_type == 'KEYWORD' and token_value == 'let':
+        token = self.tokens[self.current_token_index]
+        token_type, token_value = token
+        if token == _LET:
             return self.assignment_statement()
-        elif token_type == 'KEYWORD' and token_value == 'function':
+        elif token == _FUNCTION:
             return self.function_statement()
         elif token_type == 'IDENTIFIER':
             return self.expression()
@@ -54,11 +88,23 @@ class Parser:
         
         :return: AST node representing the assignment.
         """
-        self.consume('KEYWORD', 'let')
-        identifier = self.consume('IDENTIFIER')
-        self.consume('OPERATOR', '=')
+        tokens = self.tokens
+        i = self.current_token_index
+        if tokens[i] != _LET:
+            raise _unexpected_token('KEYWORD', 'let', tokens[i])
+        i += 1
+        token_type, identifier = tokens[i]
+        if token_type != 'IDENTIFIER':
+            raise _unexpected_token('IDENTIFIER', None, tokens[i])
+        i += 1
+        if tokens[i] != _ASSIGN:
+            raise _unexpected_token('OPERATOR', '=', tokens[i])
+        self.current_token_index = i + 1
         value = self.expression()
-        self.consume('DELIMITER', ';')
+        i = self.current_token_index
+        if tokens[i] != _SEMICOLON:
+            raise _unexpected_token('DELIMITER', ';', tokens[i])
+        self.current_token_index = i + 1
         return ASTNode(type='assignment', name=identifier, value=value)
 
     def function_statement(self):
@@ -67,21 +113,46 @@ class Parser:
         
         :return: AST node representing the function.
         """
-        self.consume('KEYWORD', 'function')
-        function_name = self.consume('IDENTIFIER')
-        self.consume('DELIMITER', '(')
+        # Hot path: work on a local index and write it back before delegating or returning
+        tokens = self.tokens
+        i = self.current_token_index
+        if tokens[i] != _FUNCTION:
+            raise _unexpected_token('KEYWORD', 'function', tokens[i])
+        i += 1
+        token_type, function_name = tokens[i]
+        if token_type != 'IDENTIFIER':
+            raise _unexpected_token('IDENTIFIER', None, tokens[i])
+        i += 1
+        if tokens[i] != _LPAREN:
+            raise _unexpected_token('DELIMITER', '(', tokens[i])
+        i += 1
         args = []
-        while self.current_token()[1] != ')':
-            args.append(self.consume('IDENTIFIER'))
-            if self.current_token()[1] == ',':
-                self.consume('DELIMITER', ',')
-        self.consume('DELIMITER', ')')
-        self.consume('DELIMITER', '{')
+        while tokens[i][1] != ')':
+            token_type, arg = tokens[i]
+            if token_type != 'IDENTIFIER':
+                raise _unexpected_token('IDENTIFIER', None, tokens[i])
+            args.append(arg)
+            i += 1
+            if tokens[i][1] == ',':
+                if tokens[i] != _COMMA:
+                    raise _unexpected_token('DELIMITER', ',', tokens[i])
+                i += 1
+        if tokens[i] != _RPAREN:
+            raise _unexpected_token('DELIMITER', ')', tokens[i])
+        i += 1
+        if tokens[i] != _LBRACE:
+            raise _unexpected_token('DELIMITER', '{', tokens[i])
+        i += 1
         body = []
-        while self.current_token()[1] != '}':
-            body.append(self.statement())
-        self.consume('DELIMITER', '}')
-        return ASTNode(type='function_call', function_name=function_name, args=args, body=body)
+        statement = self.statement
+        while tokens[i][1] != '}':
+            self.current_token_index = i
+            body.append(statement())
+            i = self.current_token_index
+        if tokens[i] != _RBRACE:
+            raise _unexpected_token('DELIMITER', '}', tokens[i])
+        self.current_token_index = i + 1
+        return ASTNode(type='function_call', function_name=function_name, args=tuple(args), body=tuple(body))
 
     def expression(self):
         """
@@ -89,10 +160,34 @@ class Parser:
         
         :return: AST node representing the expression.
         """
-        left = self.term()
-        while self.current_token()[1] in ('+', '-'):
-            operator = self.consume('OPERATOR')
-            right = self.term()
+        return self._binary(self.product, ('+', '-'))
+
+    def product(self):
+        """
+        Parse a product, so '*' and '/' bind tighter than '+' and '-'.
+        
+        :return: AST node representing the product.
+        """
+        return self._binary(self.term, ('*', '/'))
+
+    def _binary(self, operand, operators):
+        """
+        Parse a left-associative chain of operands joined by any of the given operators.
+        
+        :param operand: Method that parses one operand.
+        :param operators: Operator values accepted at this precedence level.
+        :return: AST node representing the chain.
+        """
+        tokens = self.tokens
+        left = operand()
+        i = self.current_token_index
+        while tokens[i][1] in operators:
+            token_type, operator = tokens[i]
+            if token_type != 'OPERATOR':
+                raise _unexpected_token('OPERATOR', None, tokens[i])
+            self.current_token_index = i + 1
+            right = operand()
+            i = self.current_token_index
             left = ASTNode(type='expression', left=left, right=right, operator=operator)
         return left
 
@@ -102,12 +197,13 @@ class Parser:
         
         :return: AST node representing the term.
         """
-        token_type, token_value = self.current_token()
+        # The branch already establishes the token type, so advance directly instead of re-checking in consume()
+        token_type, token_value = self.tokens[self.current_token_index]
         if token_type == 'NUMBER':
-            self.consume('NUMBER')
+            self.current_token_index += 1
             return ASTNode(type='literal', value=int(token_value))
         elif token_type == 'IDENTIFIER':
-            self.consume('IDENTIFIER')
+            self.current_token_index += 1
             return ASTNode(type='variable', name=token_value)
         else:
             raise ValueError(f"Unexpected token {token_value} at index {self.current_token_index}")
@@ -128,8 +224,9 @@ class Parser:
         :param expected_value: Optional expected value of the token.
         :return: The value of the token consumed.
         """
-        token_type, token_value = self.current_token()
+        token = self.current_token()
+        token_type, token_value = token
         if token_type != expected_type or (expected_value is not None and token_value != expected_value):
-            raise ValueError(f"Expected token {expected_type} '{expected_value}', got {token_type} '{token_value}'")
+            raise _unexpected_token(expected_type, expected_value, token)
         self.current_token_index += 1
         return token_value
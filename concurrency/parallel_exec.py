@@ -13,56 +13,65 @@ MAX_RETRIES = 3
 WORKER_RETRY_DELAY = 1  # Seconds
 
 
-def process_task(task_id, data, retry_count=0):
+def process_task(task_id, data):
     """
     Process a task with some workload, includes retry logic.
 
     Parameters:
         task_id (int): A unique identifier for the task.
         data (str): Input data to be processed.
-        retry_count (int): The current retry count.
 
     Returns:
         str: The result of the processing.
     """
-    try:
-        logger.info(f"Task {task_id} started by Process {os.getpid()}")
-        # Simulating workload with potential random failure (e.g., a Web3 transaction might fail)
-        if random.choice([True, False]) and retry_count < MAX_RETRIES:
-            raise ValueError(f"Simulated error in task {task_id} (retry count: {retry_count})")
+    for retry_count in range(MAX_RETRIES + 1):
+        try:
+            logger.info(f"Task {task_id} started by Process {os.getpid()}")
+            # Simulating workload with potential random failure (e.g., a Web3 transaction might fail)
+            if random.choice([True, False]) and retry_count < MAX_RETRIES:
+                raise ValueError(f"Simulated error in task {task_id} (retry count: {retry_count})")
 
-        time.sleep(random.uniform(1, 3))  # Simulate variable processing time
-        processed_data = data.upper()  # Example of a simple processing step
+            time.sleep(random.uniform(1, 3))  # Simulate variable processing time
+            processed_data = data.upper()  # Example of a simple processing step
 
-        logger.info(f"Task {task_id} completed by Process {os.getpid()}")
-        return f"Task {task_id}: Processed data: {processed_data}"
+            logger.info(f"Task {task_id} completed by Process {os.getpid()}")
+            return f"Task {task_id}: Processed data: {processed_data}"
 
-    except Exception as e:
-        if retry_count < MAX_RETRIES:
-            logger.warning(f"Task {task_id} failed with error '{e}', retrying... ({retry_count + 1}/{MAX_RETRIES})")
-            time.sleep(WORKER_RETRY_DELAY)
-            return process_task(task_id, data, retry_count + 1)
-        else:
-            logger.error(f"Task {task_id} failed after {MAX_RETRIES} retries")
-            return f"Task {task_id}: Failed after {MAX_RETRIES} retries"
+        except Exception as e:
+            if retry_count < MAX_RETRIES:
+                logger.warning(f"Task {task_id} failed with error '{e}', retrying... ({retry_count + 1}/{MAX_RETRIES})")
+                time.sleep(WORKER_RETRY_DELAY)
 
+    logger.error(f"Task {task_id} failed after {MAX_RETRIES} retries")
+    return f"Task {task_id}: Failed after {MAX_RETRIES} retries"
 
-def parallel_executor(tasks, max_workers=4):
+
+def parallel_executor(tasks, max_workers=4, backend='thread', initializer=None):
     """
-    Execute multiple tasks in parallel using ThreadPoolExecutor.
+    Execute multiple tasks in parallel using a thread or process pool.
 
     Parameters:
         tasks (list of tuples): A list of tasks, where each task is a tuple containing
                                 (task_id, data).
         max_workers (int): The maximum number of workers to run concurrently.
+        backend (str): 'process' for CPU-bound tasks, which would otherwise be serialized
+                       by the GIL, or 'thread' for I/O-bound tasks.
+        initializer (callable): Optional callable run once per worker, e.g. to preload
+                                heavy modules.
 
     Returns:
         list: A list of results from the processed tasks.
     """
+    if backend == 'process':
+        executor_class = concurrent.futures.ProcessPoolExecutor
+    elif backend == 'thread':
+        executor_class = concurrent.futures.ThreadPoolExecutor
+    else:
+        raise ValueError(f"Unknown backend '{backend}', expected 'process' or 'thread'")
+
     results = []
 
-    # Using ThreadPoolExecutor for managing multiple threads.
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+    with executor_class(max_workers=max_workers, initializer=initializer) as executor:
         # Mapping tasks to be processed in parallel
         future_to_task = {executor.submit(process_task, task[0], task[1]): task for task in tasks}
 
@@ -90,9 +99,9 @@ def main():
 
     start_time = time.time()
 
-    # Run the tasks in parallel with a pool of 4 workers
+    # The sample workload is CPU-bound, so run it across processes rather than threads
     logger.info("Starting task execution...")
-    results = parallel_executor(task_list, max_workers=4)
+    results = parallel_executor(task_list, max_workers=os.cpu_count(), backend='process')
 
     # Print the results
     for res in results:
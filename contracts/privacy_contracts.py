@@ -1,8 +1,23 @@
+import functools
 import hashlib
 import json
-import random
+import logging
+from datetime import datetime
+from time import time_ns
 from zksnarks import ZKSnarkProver, ZKSnarkVerifier
 
+logger = logging.getLogger(__name__)
+
+
+def _canonical(data):
+    """
+    Serialize data to key-sorted JSON bytes for hashing, byte-for-byte the encoding digests have always used.
+    Always the stdlib encoder: digests must not depend on which JSON library is installed,
+    and it accepts non-string keys and arbitrarily large ints.
+    """
+    return json.dumps(data, sort_keys=True).encode('utf-8')
+
+
 class PrivacyContract:
     def __init__(self, contract_name, owner, data):
         self.contract_name = contract_name
@@ -16,28 +31,40 @@ class PrivacyContract:
         """
         Generate zero-knowledge proof (ZKP) for the data.
         """
-        print("[PrivacyContract] Generating privacy proof...")
+        logger.debug("[PrivacyContract] Generating privacy proof...")
         zk_prover = ZKSnarkProver()
         self.proof, self.verification_key = zk_prover.generate_proof(self.data)
         self._log_event("Proof Generated", self.owner)
-        print(f"[PrivacyContract] Proof generated: {self.proof}")
+        logger.debug("[PrivacyContract] Proof generated: %s", self.proof)
 
     def verify_privacy(self):
         """
         Verify the privacy proof using a zero-knowledge verifier.
         """
-        print("[PrivacyContract] Verifying privacy proof...")
+        logger.debug("[PrivacyContract] Verifying privacy proof...")
         zk_verifier = ZKSnarkVerifier()
         is_verified = zk_verifier.verify(self.proof, self.verification_key)
         self._log_event("Proof Verification Attempt", self.owner, is_verified)
-        print(f"[PrivacyContract] Proof verified: {is_verified}")
+        logger.debug("[PrivacyContract] Proof verified: %s", is_verified)
         return is_verified
 
     def _hash_data(self, data):
         """
         Helper function to hash data.
         """
-        return hashlib.sha256(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+        return hashlib.sha256(_canonical(data)).hexdigest()
+
+    def hash_batch(self, records):
+        """
+        Hash a batch of records (e.g. audit events or transactions) into a single digest.
+        Records are streamed into one SHA-256 object instead of hashing each separately.
+        """
+        batch_hash = hashlib.sha256()
+        for record in records:
+            # Newline-separate records so adjacent serializations cannot run together
+            batch_hash.update(_canonical(record))
+            batch_hash.update(b"\n")
+        return batch_hash.hexdigest()
 
     def access_data(self, requester):
         """
@@ -59,7 +86,7 @@ class PrivacyContract:
             "user": user,
             "timestamp": self._get_timestamp()
         })
-        print(f"[PrivacyContract] Access granted to {user}")
+        logger.debug("[PrivacyContract] Access granted to %s", user)
 
     def revoke_access(self, user):
         """
@@ -70,15 +97,16 @@ class PrivacyContract:
             "user": user,
             "timestamp": self._get_timestamp()
         })
-        print(f"[PrivacyContract] Access revoked from {user}")
+        logger.debug("[PrivacyContract] Access revoked from %s", user)
 
     def audit(self):
         """
         Retrieve the audit trail of actions performed on this contract.
+
+        :return: The recorded events in order, with timestamps rendered as ISO 8601.
         """
-        print("[PrivacyContract] Retrieving audit trail...")
-        for event in self.audit_trail:
-            print(event)
+        logger.debug("[PrivacyContract] Retrieving audit trail...")
+        return [dict(event, timestamp=self._format_timestamp(event["timestamp"])) for event in self.audit_trail]
 
     def _log_event(self, event, user, result=None):
         """
@@ -91,15 +119,17 @@ class PrivacyContract:
             "timestamp": self._get_timestamp()
         }
         self.audit_trail.append(log_entry)
-        print(f"[PrivacyContract] Event logged: {log_entry}")
+        logger.debug("[PrivacyContract] Event logged: %s", log_entry)
+
+    # Events record raw nanosecond timestamps; formatting is deferred until the trail is rendered
+    _get_timestamp = staticmethod(time_ns)
 
     @staticmethod
-    def _get_timestamp():
+    def _format_timestamp(timestamp_ns):
         """
-        Helper function to get the current timestamp.
+        Helper function to render a nanosecond timestamp as ISO 8601.
         """
-        from datetime import datetime
-        return datetime.now().isoformat()
+        return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
 
     def request_transaction(self, sender, receiver, amount):
         """
@@ -111,7 +141,7 @@ class PrivacyContract:
             "amount": amount,
             "timestamp": self._get_timestamp()
         }
-        print(f"[PrivacyContract] Initiating transaction: {transaction}")
+        logger.debug("[PrivacyContract] Initiating transaction: %s", transaction)
         proof, key = self.generate_transaction_proof(transaction)
         self._log_event("Transaction Proof Generated", sender)
         return proof, key
@@ -130,7 +160,7 @@ class PrivacyContract:
         """
         zk_verifier = ZKSnarkVerifier()
         is_verified = zk_verifier.verify(proof, verification_key)
-        print(f"[PrivacyContract] Transaction verified: {is_verified}")
+        logger.debug("[PrivacyContract] Transaction verified: %s", is_verified)
         return is_verified
 
 # Zero-Knowledge SNARK Classes
@@ -140,37 +170,49 @@ class ZKSnarkProver:
     This class is used to generate zero-knowledge proofs.
     """
     def generate_proof(self, data):
-        print("[ZKSnarkProver] Generating zk-SNARK proof for the given data...")
+        logger.debug("[ZKSnarkProver] Generating zk-SNARK proof for the given data...")
         hashed_data = self._hash_data(data)
-        proof = self._simulate_proof(hashed_data)
-        verification_key = f"VerificationKey_{hashed_data[:10]}"
-        return proof, verification_key
+        return _proof_for(hashed_data)
 
     def _hash_data(self, data):
         """
         Helper function to hash data to create proof.
         """
-        return hashlib.sha256(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+        return hashlib.sha256(_canonical(data)).hexdigest()
 
-    def _simulate_proof(self, hashed_data):
+    @staticmethod
+    def _simulate_proof(hashed_data):
         """
         Simulate proof generation (normally done through cryptographic algorithms).
         """
-        random.seed(hashed_data)
-        return f"Proof_{random.randint(1000, 9999)}"
+        # Derive the digits from the hash itself; reseeding the global RNG is slow and
+        # clobbers the random state other code in the process relies on
+        return f"Proof_{int(hashed_data[:4], 16) % 9000 + 1000}"
+
+@functools.lru_cache(maxsize=4096)
+def _proof_for(hashed_data):
+    """
+    Build the (proof, verification_key) pair for a data hash.
+    The result depends only on the hash, so re-proving the same data is a cache hit.
+    """
+    proof = ZKSnarkProver._simulate_proof(hashed_data)
+    verification_key = f"VerificationKey_{hashed_data[:10]}"
+    return proof, verification_key
 
 class ZKSnarkVerifier:
     """
     This class is used to verify zero-knowledge proofs.
     """
     def verify(self, proof, verification_key):
-        print(f"[ZKSnarkVerifier] Verifying proof: {proof} with key: {verification_key}...")
+        logger.debug("[ZKSnarkVerifier] Verifying proof: %s with key: %s...", proof, verification_key)
         # Simplified verification logic
         return proof.startswith("Proof_") and verification_key.startswith("VerificationKey_")
 
 # Example Usage
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+
     # Example usage of the PrivacyContract with ZK-SNARKs
     contract = PrivacyContract("ConfidentialContract", "Alice", {"amount": 1000, "currency": "SYPHR"})
 
@@ -193,4 +235,5 @@ if __name__ == "__main__":
     contract.revoke_access("Bob")
 
     # Auditing the actions
-    contract.audit()
+    for event in contract.audit():
+        print(event)
@@ -1,17 +1,24 @@
 from flask import Flask, jsonify, request
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 app = Flask(__name__)
 
 # Blockchain RPC URL
 BLOCKCHAIN_RPC_URL = "http://localhost:8545"
 
+# Shared keep-alive session so each faucet call reuses a pooled connection to the RPC node.
+# Retries cover transient connection failures; POSTs are not replayed once sent.
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.1)))
+
 @app.route('/faucet', methods=['POST'])
 def faucet():
     address = request.json.get('address')
     if not address:
         return jsonify({"error": "Address is required"}), 400
-    
+
     # Define the faucet amount (test tokens)
     faucet_amount = 100
 
@@ -22,8 +29,9 @@ def faucet():
         "amount": faucet_amount
     }
 
-    response = requests.post(f"{BLOCKCHAIN_RPC_URL}/transfer", json=transfer_data)
+    response = SESSION.post(f"{BLOCKCHAIN_RPC_URL}/transfer", json=transfer_data, timeout=5)
     return jsonify(response.json())
 
 if __name__ == '__main__':
+    # Development server only; serve wsgi:application with gunicorn in production
     app.run(host='0.0.0.0', port=9090)
@@ -0,0 +1,6 @@
+# Production entry point for the faucet. Run it under a threaded WSGI server, e.g.:
+#   gunicorn --chdir faucet -w 4 -k gthread --threads 8 wsgi:application
+# Each worker thread handles a request concurrently and shares the pooled RPC session.
+from faucet import app
+
+application = app
@@ -1,16 +1,60 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 import os
+import queue
 import subprocess
+import threading
 from tkinter import ttk
 import keyword
 import re
 
+# Keyword tables are built once at import instead of on every keystroke
+_KEYWORDS = tuple(keyword.kwlist) + ("function", "let", "encrypt", "prove_privacy", "execute_parallel")
+_KW_REGEX = re.compile(r'\b(' + '|'.join(map(re.escape, _KEYWORDS)) + r')\b')
+_AUTOCOMPLETE_TOKENS = ("function", "let", "encrypt", "decrypt", "prove_privacy", "execute_parallel", "zkp_verify", "parallel_exec", "quantum_safe")
+# Prefix trie over every completable word; the _WORD_END key holds the word that ends at a node
+_WORD_END = ""
+_AUTOCOMPLETE_TRIE = {}
+for _token in _AUTOCOMPLETE_TOKENS + tuple(keyword.kwlist):
+    _node = _AUTOCOMPLETE_TRIE
+    for _char in _token:
+        _node = _node.setdefault(_char, {})
+    _node[_WORD_END] = _token
+_WORD_BEFORE_CURSOR = re.compile(r'\w*$')
+
+
+def _completions(prefix):
+    """
+    Return every completable word starting with prefix, in alphabetical order.
+    """
+    node = _AUTOCOMPLETE_TRIE
+    for char in prefix:
+        node = node.get(char)
+        if node is None:
+            return []
+    words = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        for key, child in node.items():
+            if key == _WORD_END:
+                words.append(child)
+            else:
+                stack.append(child)
+    return sorted(words)
+
+# Oldest console lines are dropped beyond this, so runaway programs cannot grow the widget forever
+_CONSOLE_MAX_LINES = 10000
+
 class SypherLangIDE:
     def __init__(self, root):
         self.root = root
         self.root.title("SypherLang IDE")
         self.root.geometry("1000x700")
+        self._highlight_job = None
+        self._editor_view = None
+        self._proc = None
+        self._output_queue = None
         self.create_widgets()
         self.filename = None
 
@@ -46,6 +90,9 @@ class SypherLangIDE:
         self.editor = scrolledtext.ScrolledText(self.root, wrap=tk.WORD, undo=True, font=("Courier New", 12))
         self.editor.pack(fill=tk.BOTH, expand=1)
         self.editor.bind('<KeyRelease>', self.on_key_release)
+        # Re-highlight newly exposed lines when the view scrolls
+        self.editor.configure(yscrollcommand=self._on_editor_scroll)
+        self.editor.tag_config("keyword", foreground="blue", font=("Courier New", 12, "bold"))
 
         # Create Console
         self.console = scrolledtext.ScrolledText(self.root, wrap=tk.WORD, height=10, state='disabled', font=("Courier New", 12), bg='black', fg='white')
@@ -80,57 +127,148 @@ class SypherLangIDE:
             return
         self.save_file()
         command = ["python", "interpreter.py", self.filename]
-        try:
-            output = subprocess.check_output(command, stderr=subprocess.STDOUT, universal_newlines=True)
-        except subprocess.CalledProcessError as e:
-            output = e.output
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.kill()
 
         self.console.configure(state='normal')
         self.console.delete(1.0, tk.END)
-        self.console.insert(tk.INSERT, output)
         self.console.configure(state='disabled')
 
+        # Stream output as it arrives: a reader thread feeds a queue that the Tk loop drains
+        self._proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+        self._output_queue = queue.Queue()
+        threading.Thread(target=self._read_output, args=(self._proc, self._output_queue), daemon=True).start()
+        self.root.after(50, self._drain_output, self._output_queue)
+
+    @staticmethod
+    def _read_output(proc, output_queue):
+        with proc.stdout:
+            for line in proc.stdout:
+                output_queue.put(line)
+        proc.wait()
+        output_queue.put(None)
+
+    def _drain_output(self, output_queue):
+        if output_queue is not self._output_queue:
+            return  # Superseded by a newer run
+        lines = []
+        finished = False
+        while True:
+            try:
+                line = output_queue.get_nowait()
+            except queue.Empty:
+                break
+            if line is None:
+                finished = True
+                break
+            lines.append(line)
+
+        if lines:
+            self.console.configure(state='normal')
+            self.console.insert(tk.END, ''.join(lines))
+            excess = int(self.console.index('end-1c').split('.')[0]) - _CONSOLE_MAX_LINES
+            if excess > 0:
+                self.console.delete(1.0, f"{excess + 1}.0")
+            self.console.see(tk.END)
+            self.console.configure(state='disabled')
+
+        if not finished:
+            self.root.after(50, self._drain_output, output_queue)
+
     def syntax_highlight(self):
         """
-        Highlight SypherLang keywords in the editor.
+        Highlight SypherLang keywords across the whole editor buffer.
         """
-        self.editor.tag_remove("keyword", "1.0", tk.END)
-        words = r'\b(' + '|'.join(keyword.kwlist + ["function", "let", "encrypt", "prove_privacy", "execute_parallel"]) + r')\b'
-        matches = re.finditer(words, self.editor.get(1.0, tk.END))
+        self._highlight_range("1.0", tk.END)
 
-        for match in matches:
-            start_idx = f"1.0 + {match.start()} chars"
-            end_idx = f"1.0 + {match.end()} chars"
-            self.editor.tag_add("keyword", start_idx, end_idx)
+    def _highlight_visible(self):
+        """
+        Highlight keywords in the visible lines only, so the cost per edit tracks the viewport, not the file size.
+        """
+        self._highlight_job = None
+        first = self.editor.index("@0,0 linestart")
+        last = self.editor.index("@0,%d lineend" % self.editor.winfo_height())
+        self._highlight_range(first, last)
 
-        self.editor.tag_config("keyword", foreground="blue", font=("Courier New", 12, "bold"))
+    def _highlight_range(self, first, last):
+        self.editor.tag_remove("keyword", first, last)
+        for match in _KW_REGEX.finditer(self.editor.get(first, last)):
+            self.editor.tag_add("keyword", f"{first}+{match.start()}c", f"{first}+{match.end()}c")
+
+    def _schedule_highlight(self):
+        # Debounce bursts of typing or scrolling into a single highlight pass
+        if self._highlight_job is not None:
+            self.root.after_cancel(self._highlight_job)
+        self._highlight_job = self.root.after(50, self._highlight_visible)
+
+    def _on_editor_scroll(self, first, last):
+        self.editor.vbar.set(first, last)
+        if (first, last) != self._editor_view:
+            self._editor_view = (first, last)
+            self._schedule_highlight()
 
     def on_key_release(self, event=None):
         """
         Highlight syntax after key release.
         """
-        self.syntax_highlight()
+        self._schedule_highlight()
 
     def autocomplete(self):
         """
         Provide simple autocompletion for common SypherLang functions and keywords.
         """
+        prefix = self._word_before_cursor()
+        if not prefix:
+            return
+        completions = [word for word in _completions(prefix) if word != prefix]
+        if len(completions) == 1:
+            self.editor.insert(tk.INSERT, completions[0][len(prefix):])
+        elif completions:
+            self._show_completions(prefix, completions)
+
+    def _word_before_cursor(self):
         cursor_position = self.editor.index(tk.INSERT)
         line_content = self.editor.get(f"{cursor_position} linestart", cursor_position)
-        tokens = ["function", "let", "encrypt", "decrypt", "prove_privacy", "execute_parallel", "zkp_verify", "parallel_exec", "quantum_safe"]
+        return _WORD_BEFORE_CURSOR.search(line_content).group()
 
-        for token in tokens:
-            if line_content.endswith(token[:3]):
-                self.editor.insert(tk.INSERT, token[3:])
-                return
+    def _show_completions(self, prefix, completions):
+        """
+        Let the user pick one of several completions from a popup list under the cursor.
+        """
+        popup = tk.Toplevel(self.root)
+        popup.overrideredirect(True)
+        bbox = self.editor.bbox(tk.INSERT) or (0, 0, 0, 0)
+        x = self.editor.winfo_rootx() + bbox[0]
+        y = self.editor.winfo_rooty() + bbox[1] + bbox[3]
+        popup.geometry(f"+{x}+{y}")
+
+        listbox = tk.Listbox(popup, height=min(len(completions), 8), font=("Courier New", 12))
+        for word in completions:
+            listbox.insert(tk.END, word)
+        listbox.pack()
+        listbox.selection_set(0)
+        listbox.focus_set()
+
+        def close(event=None):
+            popup.destroy()
+            self.editor.focus_set()
+
+        def accept(event=None):
+            selection = listbox.curselection()
+            if selection:
+                self.editor.insert(tk.INSERT, completions[selection[0]][len(prefix):])
+            close()
+
+        listbox.bind('<Return>', accept)
+        listbox.bind('<Double-Button-1>', accept)
+        listbox.bind('<Escape>', close)
+        listbox.bind('<FocusOut>', close)
 
     def autocomplete_suggestions(self, event=None):
         """
         Suggest possible completions based on current text input.
         """
-        cursor_index = self.editor.index(tk.INSERT)
-        current_line = self.editor.get(f"{cursor_index} linestart", cursor_index)
-        possible_completions = [kw for kw in keyword.kwlist if current_line.strip() in kw]
+        possible_completions = _completions(self._word_before_cursor())
         if possible_completions:
             self.console.configure(state='normal')
             self.console.insert(tk.END, "\nSuggestions: " + ', '.join(possible_completions))
@@ -155,10 +293,21 @@ class SypherLangIDE:
         def replace_text():
             find_text = find_entry.get()
             replace_text = replace_entry.get()
-            content = self.editor.get(1.0, tk.END)
-            new_content = content.replace(find_text, replace_text)
-            self.editor.delete(1.0, tk.END)
-            self.editor.insert(1.0, new_content)
+            if not find_text:
+                return
+            # Edit each match in place so undo history, tags and the cursor survive
+            match_length = tk.IntVar()
+            index = "1.0"
+            self.editor.edit_separator()
+            while True:
+                index = self.editor.search(find_text, index, stopindex=tk.END, count=match_length, regexp=False)
+                if not index:
+                    break
+                self.editor.delete(index, f"{index}+{match_length.get()}c")
+                self.editor.insert(index, replace_text)
+                index = self.editor.index(f"{index}+{len(replace_text)}c")
+            self.editor.edit_separator()
+            self._schedule_highlight()
 
         replace_button = tk.Button(find_window, text="Replace All", command=replace_text)
         replace_button.grid(row=2, column=1, sticky=tk.W, padx=4, pady=4)
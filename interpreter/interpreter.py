@@ -1,4 +1,5 @@
 import ast
+import functools
 import operator as op
 import sys
 import traceback
@@ -24,58 +25,67 @@ class SypherLangInterpreter:
             ast.And: op.and_,
             ast.Or: op.or_,
         }
+        # Validation depends on this instance's operator table, so compiled programs are cached per instance
+        self._compiled_program = functools.lru_cache(maxsize=1024)(self._compile_source)
+        # Programs are closed arithmetic over literals (no names survive validation), so a source string
+        # always evaluates to the same immutable value; failed runs raise and are never cached
+        self._program_result = functools.lru_cache(maxsize=1024)(self._run_source)
         
     def interpret(self, code):
         try:
-            # Parse the code into an AST (Abstract Syntax Tree)
-            parsed_code = ast.parse(code, mode='eval')
-            
-            # Evaluate the AST recursively
-            result = self._evaluate(parsed_code.body)
-            return result
+            return self._program_result(code)
         except Exception as e:
             # Catch and print detailed error traceback
             traceback.print_exc()
             return f"Error: {str(e)}"
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse(code):
+        """
+        Parse the code into an AST (Abstract Syntax Tree); repeated inputs skip the parser.
+        """
+        return ast.parse(code, mode='eval')
+
+    def _run_source(self, code):
+        # Parse, validate and compile the code to Python bytecode (cached per source string),
+        # then run it on the Python VM with no builtins reachable
+        program = self._compiled_program(code)
+        return eval(program, {"__builtins__": {}}, {})
+
+    def _compile_source(self, code):
+        tree = self._parse(code)
+        self._validate(tree)
+        return compile(tree, '<sypher>', 'eval')
+
+    def _validate(self, tree):
+        """
+        Reject any node outside the supported arithmetic subset before the tree is handed to compile().
+        """
+        for node in ast.walk(tree):
+            node_type = type(node)
+            if node_type in self.operators:
+                continue
+            if node_type not in _ALLOWED_NODES or (node_type is ast.Constant and not _is_number(node.value)):
+                raise TypeError(f"Unsupported type: {node_type}")
+
     def _evaluate(self, node):
         """
-        Recursively evaluate an AST node.
+        Evaluate an AST node through the same validate, compile and eval path as interpret().
         """
-        if isinstance(node, ast.Expression):
-            return self._evaluate(node.body)
-        
-        elif isinstance(node, ast.Num):  # <number>
-            return node.n
-        
-        elif isinstance(node, ast.BinOp):  # <left> <operator> <right>
-            left = self._evaluate(node.left)
-            right = self._evaluate(node.right)
-            operator_func = self.operators[type(node.op)]
-            return operator_func(left, right)
-        
-        elif isinstance(node, ast.UnaryOp):  # <operator> <operand>
-            operand = self._evaluate(node.operand)
-            operator_func = self.operators[type(node.op)]
-            return operator_func(operand)
-        
-        elif isinstance(node, ast.Compare):  # <left> <comparator> <right>
-            left = self._evaluate(node.left)
-            comparators = [self._evaluate(comp) for comp in node.comparators]
-            comparison = type(node.ops[0])
-            operator_func = self.operators[comparison]
-            return operator_func(left, comparators[0])
-        
-        elif isinstance(node, ast.BoolOp):  # <left> <boolop> <right>
-            values = [self._evaluate(v) for v in node.values]
-            bool_op_func = self.operators[type(node.op)]
-            result = values[0]
-            for value in values[1:]:
-                result = bool_op_func(result, value)
-            return result
-        
-        else:
-            raise TypeError(f"Unsupported type: {type(node)}")
+        tree = node if isinstance(node, ast.Expression) else ast.Expression(body=node)
+        self._validate(tree)
+        program = compile(ast.fix_missing_locations(tree), '<sypher>', 'eval')
+        return eval(program, {"__builtins__": {}}, {})
+
+
+# Node types a program may contain besides the operators in SypherLangInterpreter.operators
+_ALLOWED_NODES = frozenset({ast.Expression, ast.Constant, ast.BinOp, ast.UnaryOp, ast.Compare, ast.BoolOp})
+
+
+def _is_number(value):
+    return isinstance(value, (int, float, complex)) and not isinstance(value, bool)
+
 
 if __name__ == "__main__":
     interpreter = SypherLangInterpreter()
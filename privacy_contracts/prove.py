@@ -1,14 +1,22 @@
+import functools
+
 from Crypto.Hash import SHA256
 from Crypto.Signature import pss
 from Crypto.PublicKey import RSA
 
+@functools.lru_cache(maxsize=32)
+def _signer(private_key_pem):
+    # PEM parsing dominates a single sign, so each distinct key is imported once
+    return pss.new(RSA.import_key(private_key_pem))
+
+
 def generate_proof(data, private_key):
     """
     Generate a cryptographic proof for the given data using a private key.
 
     Parameters:
         data (str): The input data for which proof needs to be generated.
-        private_key (str): The RSA private key in PEM format.
+        private_key (str | bytes | RSA.RsaKey): The RSA private key in PEM format, or an imported key.
 
     Returns:
         dict: A dictionary containing the original data, a signature for verification,
@@ -17,11 +25,12 @@ def generate_proof(data, private_key):
     # Create hash of the data
     data_hash = SHA256.new(data.encode('utf-8'))
 
-    # Load private key
-    key = RSA.import_key(private_key)
-
     # Sign the hash using the private key
-    signature = pss.new(key).sign(data_hash)
+    if isinstance(private_key, RSA.RsaKey):
+        signer = pss.new(private_key)
+    else:
+        signer = _signer(private_key)
+    signature = signer.sign(data_hash)
 
     # Return a dictionary that includes data, hash, and signature
     proof = {
@@ -1,36 +1,97 @@
+import functools
+
 from Crypto.Hash import SHA256
 from Crypto.Signature import pss
 from Crypto.PublicKey import RSA
 
-def verify_proof(proof, public_key):
+@functools.lru_cache(maxsize=32)
+def _verifier(public_key_pem):
+    return pss.new(RSA.import_key(public_key_pem))
+
+
+class _PrecomputedSHA256:
+    """
+    Stand-in for a finished SHA256 object whose digest is already known.
+    PSS verification only needs digest(), digest_size and new().
+    """
+
+    digest_size = SHA256.digest_size
+
+    def __init__(self, digest):
+        if len(digest) != self.digest_size:
+            raise ValueError("SHA256 digest must be 32 bytes")
+        self._digest = digest
+
+    def digest(self):
+        return self._digest
+
+    def new(self, data=None):
+        return SHA256.new(data)
+
+
+def _resolve_verifier(public_key):
+    if isinstance(public_key, RSA.RsaKey):
+        return pss.new(public_key)
+    return _verifier(public_key)
+
+
+def _verify_with(verifier, proof, trust_hash):
+    try:
+        signature = bytes.fromhex(proof["signature"])
+
+        if trust_hash:
+            # The caller vouches for the proof's hash, so the data is not hashed again
+            data_hash = _PrecomputedSHA256(bytes.fromhex(proof["hash"]))
+        else:
+            # Recreate the hash from the provided data
+            data_hash = SHA256.new(proof["data"].encode('utf-8'))
+
+        # Verify the signature using the hash and public key
+        verifier.verify(data_hash, signature)
+
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def verify_proof(proof, public_key, trust_hash=False):
     """
     Verify the provided proof using a public key.
 
     Parameters:
         proof (dict): The proof to verify, which includes the data, its hash, and the signature.
-        public_key (str): The RSA public key in PEM format.
+        public_key (str | bytes | RSA.RsaKey): The RSA public key in PEM format, or an imported key.
+        trust_hash (bool): Verify against the proof's "hash" field instead of re-hashing its data.
+            Only use this when the proof comes from a trusted pipeline.
 
     Returns:
         bool: True if the proof is valid, otherwise False.
     """
     try:
-        # Extract data and the original hash from the proof
-        data = proof["data"]
-        signature = bytes.fromhex(proof["signature"])
+        verifier = _resolve_verifier(public_key)
+    except (ValueError, TypeError):
+        return False
+    return _verify_with(verifier, proof, trust_hash)
 
-        # Recreate the hash from the provided data
-        data_hash = SHA256.new(data.encode('utf-8'))
 
-        # Load the public key
-        key = RSA.import_key(public_key)
+def verify_proofs_batch(proofs, public_key, trust_hash=False):
+    """
+    Verify many proofs made under the same public key.
 
-        # Verify the signature using the hash and public key
-        verifier = pss.new(key)
-        verifier.verify(data_hash, signature)
+    Parameters:
+        proofs (iterable of dict): The proofs to verify, in the format accepted by verify_proof.
+        public_key (str | bytes | RSA.RsaKey): The RSA public key in PEM format, or an imported key.
+        trust_hash (bool): Verify against each proof's "hash" field, as in verify_proof.
 
-        return True
+    Returns:
+        list of bool: The verification result for each proof, in order.
+    """
+    proofs = list(proofs)
+    try:
+        verifier = _resolve_verifier(public_key)
     except (ValueError, TypeError):
-        return False
+        return [False] * len(proofs)
+    return [_verify_with(verifier, proof, trust_hash) for proof in proofs]
 
 # Example usage
 if __name__ == "__main__":
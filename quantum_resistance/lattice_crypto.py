@@ -1,7 +1,200 @@
 import numpy as np
+import functools
 import hashlib
-from sympy import isprime
+import logging
+import os
 import secrets
+from concurrent.futures import ProcessPoolExecutor
+from Crypto.Cipher import ChaCha20
+
+try:
+    from numba import njit, types
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+logger = logging.getLogger(__name__)
+
+
+def _ntt_stages_numpy(a, omegas, q):
+    # Iterative Cooley-Tukey over a bit-reversed input; each stage's butterflies run as one vectorized op
+    n = a.shape[0]
+    length = 2
+    while length <= n:
+        half = length // 2
+        w = omegas[::n // length][:half]
+        blocks = a.reshape(-1, length)
+        u = blocks[:, :half]
+        v = blocks[:, half:] * w % q
+        a = np.concatenate(((u + v) % q, (u - v) % q), axis=1).reshape(n)
+        length *= 2
+    return a
+
+
+def _weighted_ntt_numpy(a, psi_powers, omegas, bit_reversal, q):
+    # Reduce, apply the psi^i twist, permute into bit-reversed order, then the forward butterflies
+    return _ntt_stages_numpy(((a % q) * psi_powers % q)[bit_reversal], omegas, q)
+
+
+def _pointwise_intt_numpy(x_hat, y_hat, addend, inv_omegas, inv_psi_scaled, bit_reversal, q):
+    # Pointwise product in NTT form, inverse butterflies, then the psi^-i / n scaling and the addend
+    a = _ntt_stages_numpy((x_hat * y_hat % q)[bit_reversal], inv_omegas, q)
+    a *= inv_psi_scaled
+    a += addend
+    a %= q
+    return a
+
+
+# Coefficient dtypes LatticeCrypto uses (see LatticeCrypto._dtype)
+_NTT_SIGNATURES = ['int32[:](int32[:], int32[:], int64)', 'int64[:](int64[:], int64[:], int64)']
+
+if HAS_NUMBA:
+    # JIT-compiled butterfly loop: the whole transform runs in place with no temporaries per stage.
+    # Explicit signatures compile (or load from the on-disk cache) at import, so the first transform
+    # does not pay JIT latency. The kernels release the GIL, so transforms on different threads
+    # (e.g. concurrent requests in a threaded server) run on separate cores.
+    @njit(_NTT_SIGNATURES, cache=True, nogil=True)
+    def _ntt_stages(a, omegas, q):
+        n = a.shape[0]
+        length = 2
+        while length <= n:
+            half = length // 2
+            step = n // length
+            for start in range(0, n, length):
+                for j in range(half):
+                    u = a[start + j]
+                    v = a[start + j + half] * omegas[j * step] % q
+                    # u and v are already reduced, so each output needs at most one correction by q;
+                    # it is applied arithmetically rather than by a division or a data-dependent branch
+                    total = u + v - q
+                    difference = u - v
+                    a[start + j] = total + q * (total < 0)
+                    a[start + j + half] = difference + q * (difference < 0)
+            length *= 2
+        return a
+
+    def _weighted_ntt_signature(dtype):
+        operand = types.Array(dtype, 1, 'A', readonly=True)
+        index = types.Array(types.int64, 1, 'A', readonly=True)
+        return dtype[:](operand, operand, dtype[:], index, types.int64)
+
+    # Forward transform in one compiled call: reduction, twist and bit-reversal gather write straight into
+    # the output buffer, which the butterflies then transform in place, so the result is the only allocation
+    @njit([_weighted_ntt_signature(types.int32), _weighted_ntt_signature(types.int64)], cache=True, nogil=True)
+    def _weighted_ntt(a, psi_powers, omegas, bit_reversal, q):
+        n = a.shape[0]
+        out = np.empty_like(a)
+        for i in range(n):
+            j = bit_reversal[i]
+            out[i] = a[j] % q * psi_powers[j] % q
+        return _ntt_stages(out, omegas, q)
+
+    def _pointwise_intt_signature(dtype):
+        # Operands may be read-only (e.g. cached expansions of a); the inverse omegas feed _ntt_stages as-is
+        operand = types.Array(dtype, 1, 'A', readonly=True)
+        index = types.Array(types.int64, 1, 'A', readonly=True)
+        return dtype[:](operand, operand, operand, dtype[:], operand, index, types.int64)
+
+    # intt(x_hat * y_hat) + addend in one compiled call: the product is written straight into the
+    # bit-reversed working buffer and scaling, addend and reduction share the final loop, so the
+    # product, permuted copy and scaled intermediates are never materialized
+    @njit([_pointwise_intt_signature(types.int32), _pointwise_intt_signature(types.int64)], cache=True, nogil=True)
+    def _pointwise_intt(x_hat, y_hat, addend, inv_omegas, inv_psi_scaled, bit_reversal, q):
+        n = x_hat.shape[0]
+        a = np.empty_like(x_hat)
+        for i in range(n):
+            j = bit_reversal[i]
+            a[i] = x_hat[j] * y_hat[j] % q
+        _ntt_stages(a, inv_omegas, q)
+        for i in range(n):
+            a[i] = (a[i] * inv_psi_scaled[i] + addend[i]) % q
+        return a
+else:
+    _ntt_stages = _ntt_stages_numpy
+    _weighted_ntt = _weighted_ntt_numpy
+    _pointwise_intt = _pointwise_intt_numpy
+
+
+# NTT-friendly primes used by NewHope, Kyber (old and new) and Dilithium
+_KNOWN_PRIMES = frozenset({12289, 7681, 3329, 8380417})
+
+# Witnesses that make Miller-Rabin deterministic for every n < 3.3 * 10**24
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def _miller_rabin(n):
+    """
+    Deterministic Miller-Rabin primality test.
+    """
+    if n < 2:
+        return False
+    for p in _MILLER_RABIN_BASES:
+        if n % p == 0:
+            return n == p
+    d, r = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+    for a in _MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _primitive_root_of_unity(order, q):
+    """
+    Find a primitive root of unity of the given power-of-two order modulo the prime q.
+    """
+    for g in range(2, q):
+        root = pow(g, (q - 1) // order, q)
+        # For a power-of-two order, the root is primitive exactly when root^(order/2) == -1
+        if pow(root, order // 2, q) == q - 1:
+            return root
+    raise ValueError(f"No primitive {order}-th root of unity modulo {q}.")
+
+
+@functools.lru_cache(maxsize=8)
+def _ntt_tables(n, q, dtype):
+    """
+    Twiddle and permutation tables for the negacyclic NTT of degree n modulo q, built once per
+    parameter set and shared by every LatticeCrypto instance. Callers must not modify them.
+
+    :return: A tuple (psi_powers, inv_psi_scaled, omegas, inv_omegas, bit_reversal).
+    """
+    # psi is a primitive 2n-th root of unity and omega = psi^2
+    psi = _primitive_root_of_unity(2 * n, q)
+    psi_inv = pow(psi, q - 2, q)
+    omega, omega_inv = psi * psi % q, psi_inv * psi_inv % q
+    exponents = range(n)
+    psi_powers = np.array([pow(psi, i, q) for i in exponents], dtype=dtype)
+    # The inverse transform's psi^-i twist and 1/n scaling are folded into one table
+    n_inv = pow(n, q - 2, q)
+    inv_psi_scaled = np.array([pow(psi_inv, i, q) * n_inv % q for i in exponents], dtype=dtype)
+    omegas = np.array([pow(omega, i, q) for i in exponents[:n // 2]], dtype=dtype)
+    inv_omegas = np.array([pow(omega_inv, i, q) for i in exponents[:n // 2]], dtype=dtype)
+    bits = n.bit_length() - 1
+    bit_reversal = np.array([int(format(i, f'0{bits}b')[::-1], 2) if bits else 0 for i in exponents], dtype=np.int64)
+    return psi_powers, inv_psi_scaled, omegas, inv_omegas, bit_reversal
+
+
+@functools.lru_cache(maxsize=8)
+def _worker_crypto(n, q, standard_deviation):
+    # One instance per parameter set in each worker process, so its NTT tables are built once
+    return LatticeCrypto(n, q, standard_deviation)
+
+
+def _encapsulate_batch(parameters, public_keys):
+    # Process-pool entry point: encapsulate a contiguous run of public keys
+    crypto = _worker_crypto(*parameters)
+    return [crypto.encapsulate(public_key) for public_key in public_keys]
+
 
 class LatticeCrypto:
     """
@@ -9,116 +202,279 @@ class LatticeCrypto:
     key encapsulation, and signature schemes. These functions are designed to be quantum-resistant.
     """
 
+    # Worker pool for encapsulate_many and its size, shared by every instance and started on first use
+    _executor = None
+    _executor_workers = 0
+
     def __init__(self, n=512, q=12289, standard_deviation=3.2):
         """
         Initialize LatticeCrypto with key parameters for lattice size, modulus, and standard deviation.
 
-        :param n: Dimension of the lattice, typically a power of 2 for efficiency.
-        :param q: Modulus, should be a prime number.
+        :param n: Degree of the ring Z_q[x]/(x^n+1), must be a power of 2.
+        :param q: Modulus, must be a prime with q = 1 (mod 2n) so the NTT exists.
         :param standard_deviation: Standard deviation for generating noise (error).
         """
         self.n = n
         self.q = q
         self.std_dev = standard_deviation
-        if not isprime(q):
+        # Expanded NTT forms of a, keyed by public-key seed, so repeated peers skip the expansion
+        self._a_hat = functools.lru_cache(maxsize=256)(self._expand_seed)
+        if q not in _KNOWN_PRIMES and not _miller_rabin(q):
             raise ValueError(f"Modulus q must be a prime number, {q} is not prime.")
-        print(f"[LatticeCrypto] Initialized with n={self.n}, q={self.q}, standard_deviation={self.std_dev}")
+        if n & (n - 1) or (q - 1) % (2 * n):
+            raise ValueError(f"n must be a power of 2 dividing (q - 1) / 2, got n={n}, q={q}.")
+
+        # Coefficients are kept in int32 whenever a product of two residues plus one more residue fits,
+        # which halves the memory traffic of every transform for the usual NTT primes
+        self._dtype = np.int32 if q * q + q < 2 ** 31 else np.int64
+        # Keys and ciphertexts leave the class as unsigned residues in the narrowest dtype that holds q,
+        # e.g. 2 bytes per coefficient for q = 12289; the transforms widen them to self._dtype on entry
+        self._storage_dtype = np.uint16 if q <= 2 ** 16 else np.uint32
+
+        # Negacyclic NTT tables, shared with every other instance using the same n and q
+        (self._psi_powers, self._inv_psi_scaled, self._omegas,
+         self._inv_omegas, self._bit_reversal) = _ntt_tables(n, q, self._dtype)
+        # Addend for products that have no noise term
+        self._zero_poly = np.zeros(n, dtype=self._dtype)
+        logger.debug("[LatticeCrypto] Initialized with n=%s, q=%s, standard_deviation=%s", self.n, self.q, self.std_dev)
+
+    def _ntt(self, a):
+        """
+        Forward negacyclic NTT of a polynomial in Z_q[x]/(x^n+1).
+
+        :param a: Coefficient vector of length n.
+        :return: The polynomial in NTT (evaluation) form.
+        """
+        return _weighted_ntt(np.asarray(a, dtype=self._dtype), self._psi_powers, self._omegas, self._bit_reversal, self.q)
+
+    def _intt_product(self, x_hat, y_hat, addend=None):
+        """
+        Inverse negacyclic NTT of the pointwise product of two NTT-form polynomials.
+
+        :param x_hat: Polynomial in NTT form.
+        :param y_hat: Polynomial in NTT form.
+        :param addend: Optional coefficient vector added before the final reduction,
+                       so a * b + e (mod q) needs no extra buffers or passes.
+        :return: Coefficient vector of length n.
+        """
+        return _pointwise_intt(x_hat, y_hat, self._zero_poly if addend is None else addend,
+                               self._inv_omegas, self._inv_psi_scaled, self._bit_reversal, self.q)
+
+    def _ntt_mul(self, a, b):
+        """
+        Multiply two polynomials in Z_q[x]/(x^n+1) in O(n log n) via the NTT.
+
+        :param a: Coefficient vector of length n.
+        :param b: Coefficient vector of length n.
+        :return: Coefficient vector of a * b.
+        """
+        return self._intt_product(self._ntt(a), self._ntt(b))
+
+    @staticmethod
+    def _random_words(count):
+        """
+        Draw uniformly random 32-bit words from a ChaCha20 keystream under a fresh key.
+
+        :param count: Number of words to draw.
+        :return: uint32 array of length count.
+        """
+        keystream = ChaCha20.new(key=secrets.token_bytes(32)).encrypt(bytes(4 * count))
+        return np.frombuffer(keystream, dtype=np.uint32)
+
+    def _sample_noise(self, rows=1):
+        """
+        Sample Gaussian noise vectors with the configured standard deviation, reduced mod q.
+
+        :param rows: Number of noise vectors to draw in one keystream.
+        :return: Noise array of shape (rows, n).
+        """
+        # Box-Muller over CSPRNG words; u1 is shifted into (0, 1] so the log is always finite
+        words = self._random_words(2 * rows * self.n).reshape(2, rows, self.n)
+        u1 = (words[0] + 1.0) / 2.0 ** 32
+        u2 = words[1] / 2.0 ** 32
+        noise = np.sqrt(-2.0 * np.log(u1))
+        noise *= np.cos(2.0 * np.pi * u2)
+        noise *= self.std_dev
+        # Round to the nearest integer in place; truncation would pile extra mass onto zero
+        np.rint(noise, out=noise)
+        return noise.astype(self._dtype) % self.q
+
+    def _expand_seed(self, seed):
+        """
+        Expand a public seed into the shared ring element a, returned in NTT form.
+
+        :param seed: The 32-byte seed published with the public key.
+        :return: Read-only NTT form of a.
+        """
+        seed_words = np.frombuffer(hashlib.sha3_256(seed).digest(), dtype=np.uint32)
+        a = np.random.default_rng(seed_words).integers(0, self.q, self.n, dtype=self._dtype)
+        a_hat = self._ntt(a)
+        a_hat.flags.writeable = False
+        return a_hat
 
     def generate_keypair(self):
         """
-        Generate a public-private keypair using lattice-based Learning With Errors (LWE) cryptosystem.
+        Generate a public-private keypair using lattice-based Ring Learning With Errors (Ring-LWE) cryptosystem.
 
-        :return: A tuple of (public_key, private_key)
+        :return: A tuple of (public_key, private_key), where public_key is (seed, b)
         """
-        print("[LatticeCrypto] Generating public-private keypair...")
-        
-        # Generate a random private key vector s
-        s = np.random.randint(0, self.q, self.n)
-        print(f"[LatticeCrypto] Generated private key s: {s}")
+        logger.debug("[LatticeCrypto] Generating public-private keypair...")
 
-        # Generate a random matrix A of dimensions n x n
-        A = np.random.randint(0, self.q, (self.n, self.n))
-        print(f"[LatticeCrypto] Generated random matrix A: {A}")
+        # The ring element a is published as a seed and expanded on demand
+        seed = secrets.token_bytes(32)
+        a_hat = self._a_hat(seed)
+        logger.debug("[LatticeCrypto] Generated seed for a: %s", seed.hex())
 
-        # Generate a noise vector e based on the Gaussian distribution
-        e = np.random.normal(0, self.std_dev, self.n).astype(int) % self.q
-        print(f"[LatticeCrypto] Generated noise vector e: {e}")
+        # Generate a small private key vector s and a noise vector e based on the Gaussian distribution
+        s, e = self._sample_noise(2)
+        logger.debug("[LatticeCrypto] Generated private key s: %s", s)
+        logger.debug("[LatticeCrypto] Generated noise vector e: %s", e)
 
-        # Compute the public key as A * s + e (mod q)
-        public_key = (A @ s + e) % self.q
-        print(f"[LatticeCrypto] Generated public key: {public_key}")
+        # Compute the public key as b = a * s + e (mod q)
+        b = self._intt_product(a_hat, self._ntt(s), e).astype(self._storage_dtype)
+        logger.debug("[LatticeCrypto] Generated public key: %s", b)
 
-        return public_key, s
+        return (seed, b), s.astype(self._storage_dtype)
 
     def encapsulate(self, public_key):
         """
-        Encapsulate a shared secret using the public key, leveraging LWE.
+        Encapsulate a shared secret using the public key, leveraging Ring-LWE.
 
-        :param public_key: The public key of the recipient.
-        :return: A tuple (ciphertext, shared_secret)
+        :param public_key: The public key (seed, b) of the recipient.
+        :return: A tuple (ciphertext, shared_secret), where ciphertext is (u, v)
         """
-        print("[LatticeCrypto] Encapsulating shared secret...")
+        logger.debug("[LatticeCrypto] Encapsulating shared secret...")
+        seed, b = public_key
 
         # Generate a random message vector m
-        m = np.random.randint(0, 2, self.n)
-        print(f"[LatticeCrypto] Generated random message vector m: {m}")
+        m = (self._random_words(self.n) & 1).astype(self._dtype)
+        logger.debug("[LatticeCrypto] Generated random message vector m: %s", m)
 
-        # Generate random vector r
-        r = np.random.randint(0, self.q, self.n)
-        print(f"[LatticeCrypto] Generated random vector r: {r}")
+        # Generate the small ephemeral vector r and the noise terms
+        r, e1, e2 = self._sample_noise(3)
+        logger.debug("[LatticeCrypto] Generated random vector r: %s", r)
 
-        # Compute ciphertext as A^T * r + m (mod q)
-        A_T = np.random.randint(0, self.q, (self.n, self.n))  # Simulate A^T matrix
-        ciphertext = (A_T @ r + m) % self.q
-        print(f"[LatticeCrypto] Generated ciphertext: {ciphertext}")
+        # Compute ciphertext as u = a * r + e1, v = b * r + e2 + m * floor(q/2) (mod q)
+        r_hat = self._ntt(r)
+        u = self._intt_product(self._a_hat(seed), r_hat, e1)
+        e2 += m * (self.q // 2)
+        v = self._intt_product(self._ntt(b), r_hat, e2)
+        ciphertext = (u.astype(self._storage_dtype), v.astype(self._storage_dtype))
+        logger.debug("[LatticeCrypto] Generated ciphertext: %s", ciphertext)
 
         # Generate the shared secret by hashing the message
         shared_secret = hashlib.sha3_256(m).hexdigest()
-        print(f"[LatticeCrypto] Generated shared secret: {shared_secret}")
+        logger.debug("[LatticeCrypto] Generated shared secret: %s", shared_secret)
 
         return ciphertext, shared_secret
 
+    def encapsulate_many(self, public_keys, max_workers=None):
+        """
+        Encapsulate a fresh shared secret for each of many recipients, spread across CPU cores.
+
+        :param public_keys: Iterable of recipient public keys (seed, b).
+        :param max_workers: Worker processes to use; defaults to the CPU count.
+        :return: A list of (ciphertext, shared_secret) tuples, in public key order.
+        """
+        public_keys = list(public_keys)
+        workers = min(max_workers or os.cpu_count() or 1, len(public_keys))
+        if workers <= 1:
+            return [self.encapsulate(public_key) for public_key in public_keys]
+        logger.debug("[LatticeCrypto] Encapsulating %s shared secrets on %s workers...", len(public_keys), workers)
+
+        # Encapsulations share no state, so whole chunks go to separate processes to sidestep the GIL
+        executor = LatticeCrypto._executor
+        if executor is None or LatticeCrypto._executor_workers < workers:
+            if executor is not None:
+                executor.shutdown()
+            executor = LatticeCrypto._executor = ProcessPoolExecutor(max_workers=workers)
+            LatticeCrypto._executor_workers = workers
+        parameters = (self.n, self.q, self.std_dev)
+        chunk = -(-len(public_keys) // workers)
+        batches = [public_keys[i:i + chunk] for i in range(0, len(public_keys), chunk)]
+        futures = [executor.submit(_encapsulate_batch, parameters, batch) for batch in batches]
+        return [result for future in futures for result in future.result()]
+
+    def _decode_message(self, noisy_m):
+        """
+        Round each coefficient of v - u * s (mod q) to a message bit: 1 when it lies nearer q/2 than 0.
+        Works in place on noisy_m, so the decode allocates only the returned bit vector.
+
+        :param noisy_m: Reduced coefficients, any shape; overwritten.
+        :return: Bit array of the same shape.
+        """
+        np.subtract(noisy_m, self.q // 2, out=noisy_m)
+        np.abs(noisy_m, out=noisy_m)
+        return (noisy_m < self.q // 4).astype(self._dtype)
+
     def decapsulate(self, private_key, ciphertext):
         """
         Decapsulate the shared secret from the ciphertext using the private key.
 
         :param private_key: The private key of the recipient.
-        :param ciphertext: The received ciphertext.
+        :param ciphertext: The received ciphertext (u, v).
         :return: The shared secret.
         """
-        print("[LatticeCrypto] Decapsulating shared secret...")
+        logger.debug("[LatticeCrypto] Decapsulating shared secret...")
+        u, v = ciphertext
 
-        # Reconstruct the message m using the private key s and ciphertext
-        reconstructed_m = (ciphertext - (private_key @ np.random.randint(0, self.q, (self.n, self.n)))) % self.q
-        print(f"[LatticeCrypto] Reconstructed message vector m: {reconstructed_m}")
+        # Reconstruct the message m: v - u * s leaves m * floor(q/2) plus small noise. It is computed as
+        # u * (-s) + v so the subtraction and its reduction happen inside the fused inverse transform
+        neg_s_hat = self._ntt(-np.asarray(private_key, dtype=self._dtype))
+        noisy_m = self._intt_product(self._ntt(u), neg_s_hat, v.astype(self._dtype))
+        reconstructed_m = self._decode_message(noisy_m)
+        logger.debug("[LatticeCrypto] Reconstructed message vector m: %s", reconstructed_m)
 
         # Generate shared secret by hashing the reconstructed message
         shared_secret = hashlib.sha3_256(reconstructed_m).hexdigest()
-        print(f"[LatticeCrypto] Decapsulated shared secret: {shared_secret}")
+        logger.debug("[LatticeCrypto] Decapsulated shared secret: %s", shared_secret)
 
         return shared_secret
 
+    def decapsulate_many(self, private_key, ciphertexts):
+        """
+        Decapsulate several ciphertexts addressed to the same private key, e.g. when scanning inbound traffic.
+
+        :param private_key: The private key of the recipient.
+        :param ciphertexts: Iterable of received ciphertexts (u, v).
+        :return: A list of shared secrets, in ciphertext order.
+        """
+        ciphertexts = list(ciphertexts)
+        if not ciphertexts:
+            return []
+        logger.debug("[LatticeCrypto] Decapsulating %s shared secrets...", len(ciphertexts))
+
+        # The negated private key is transformed once for the whole batch rather than once per ciphertext
+        neg_s_hat = self._ntt(-np.asarray(private_key, dtype=self._dtype))
+        dtype = self._dtype
+        noisy_m = np.stack([self._intt_product(self._ntt(u), neg_s_hat, v.astype(dtype)) for u, v in ciphertexts])
+
+        # Decode every message in one vectorized pass, then hash each row
+        reconstructed_m = self._decode_message(noisy_m)
+        sha3_256 = hashlib.sha3_256
+        return [sha3_256(row).hexdigest() for row in reconstructed_m]
+
     def sign_falcon(self, message, private_key):
         """
         Sign a message using the Falcon signature scheme, which is lattice-based.
 
-        :param message: The hashed message to sign.
+        :param message: The hashed message to sign, as str or raw bytes.
         :param private_key: The private key to use for signing.
         :return: The generated signature.
         """
-        print("[LatticeCrypto] Generating Falcon signature...")
+        logger.debug("[LatticeCrypto] Generating Falcon signature...")
         
         # Convert message into an integer format suitable for Falcon signing
-        message_digest = int.from_bytes(hashlib.sha3_256(message.encode()).digest(), 'big') % self.q
-        print(f"[LatticeCrypto] Hashed message digest: {message_digest}")
+        message_digest = int.from_bytes(hashlib.sha3_256(message if isinstance(message, bytes) else message.encode()).digest(), 'big') % self.q
+        logger.debug("[LatticeCrypto] Hashed message digest: %s", message_digest)
 
         # Generate randomness for signature
-        randomness = np.random.normal(0, self.std_dev, self.n).astype(int) % self.q
-        print(f"[LatticeCrypto] Generated randomness for signing: {randomness}")
+        randomness = self._sample_noise()[0]
+        logger.debug("[LatticeCrypto] Generated randomness for signing: %s", randomness)
 
-        # Compute the signature using private key and randomness
-        signature = (private_key * message_digest + randomness) % self.q
-        print(f"[LatticeCrypto] Generated signature: {signature}")
+        # Compute the signature using private key and randomness; self._dtype is sized so this cannot overflow
+        signature = (np.asarray(private_key, dtype=self._dtype) * self._dtype(message_digest) + randomness) % self.q
+        logger.debug("[LatticeCrypto] Generated signature: %s", signature)
 
         return signature
 
@@ -126,27 +482,29 @@ class LatticeCrypto:
         """
         Verify a signature using the Falcon algorithm.
 
-        :param message: The original message.
+        :param message: The original message, as str or raw bytes.
         :param signature: The signature to verify.
         :param public_key: The public key for verification.
         :return: True if the signature is valid, False otherwise.
         """
-        print("[LatticeCrypto] Verifying Falcon signature...")
+        logger.debug("[LatticeCrypto] Verifying Falcon signature...")
 
         # Convert message into an integer format suitable for Falcon verification
-        message_digest = int.from_bytes(hashlib.sha3_256(message.encode()).digest(), 'big') % self.q
-        print(f"[LatticeCrypto] Hashed message digest for verification: {message_digest}")
+        message_digest = int.from_bytes(hashlib.sha3_256(message if isinstance(message, bytes) else message.encode()).digest(), 'big') % self.q
+        logger.debug("[LatticeCrypto] Hashed message digest for verification: %s", message_digest)
 
         # Perform verification
-        reconstructed_value = (public_key * message_digest) % self.q
-        is_valid = np.array_equal(signature, (reconstructed_value + np.random.randint(0, self.q, self.n)) % self.q)
-        print(f"[LatticeCrypto] Signature verification {'passed' if is_valid else 'failed'}.")
+        _, b = public_key
+        reconstructed_value = (np.asarray(b, dtype=self._dtype) * self._dtype(message_digest)) % self.q
+        is_valid = np.array_equal(signature, reconstructed_value)
+        logger.debug("[LatticeCrypto] Signature verification %s.", "passed" if is_valid else "failed")
 
         return is_valid
 
 
 # Example usage of LatticeCrypto for SypherCore
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
     lattice_crypto = LatticeCrypto()
 
     # Generate a keypair
@@ -1,8 +1,18 @@
 import hashlib
+import logging
 import secrets
 import numpy as np
+from Crypto.Cipher import AES
 from lattice_crypto import LatticeCrypto
 
+logger = logging.getLogger(__name__)
+
+# Candidate preimages generated per random draw in grover_attack_simulation
+GROVER_BATCH_SIZE = 4096
+
+# Domain-separation prefix absorbed once into the SHA-3 state that Falcon message hashes start from
+FALCON_HASH_DOMAIN = b"SypherCore/Falcon/v1"
+
 class QuantumTools:
     """
     QuantumTools provides utilities to secure SypherCore using quantum-resistant algorithms.
@@ -11,6 +21,7 @@ class QuantumTools:
 
     def __init__(self):
         self.lattice_crypto = LatticeCrypto()
+        self._sha3_base = hashlib.sha3_256(FALCON_HASH_DOMAIN)
     
     def generate_lattice_keypair(self):
         """
@@ -19,9 +30,9 @@ class QuantumTools:
         
         :return: A tuple (public_key, private_key)
         """
-        print("[QuantumTools] Generating lattice-based keypair...")
+        logger.debug("[QuantumTools] Generating lattice-based keypair...")
         public_key, private_key = self.lattice_crypto.generate_keypair()
-        print("[QuantumTools] Lattice keypair generated.")
+        logger.debug("[QuantumTools] Lattice keypair generated.")
         return public_key, private_key
     
     def encapsulate_key(self, public_key):
@@ -32,9 +43,9 @@ class QuantumTools:
         :param public_key: The public key of the recipient.
         :return: A tuple (ciphertext, shared_secret)
         """
-        print("[QuantumTools] Encapsulating key using lattice-based encryption...")
+        logger.debug("[QuantumTools] Encapsulating key using lattice-based encryption...")
         ciphertext, shared_secret = self.lattice_crypto.encapsulate(public_key)
-        print("[QuantumTools] Key encapsulated successfully.")
+        logger.debug("[QuantumTools] Key encapsulated successfully.")
         return ciphertext, shared_secret
 
     def decapsulate_key(self, private_key, ciphertext):
@@ -45,9 +56,9 @@ class QuantumTools:
         :param ciphertext: The encrypted shared secret.
         :return: The shared secret
         """
-        print("[QuantumTools] Decapsulating key...")
+        logger.debug("[QuantumTools] Decapsulating key...")
         shared_secret = self.lattice_crypto.decapsulate(private_key, ciphertext)
-        print("[QuantumTools] Key decapsulation completed successfully.")
+        logger.debug("[QuantumTools] Key decapsulation completed successfully.")
         return shared_secret
 
     def hash_quantum_safe(self, data):
@@ -57,13 +68,37 @@ class QuantumTools:
         :param data: Data to be hashed.
         :return: A hash digest of the data.
         """
-        print("[QuantumTools] Hashing data using SHA-3 (Keccak)...")
+        logger.debug("[QuantumTools] Hashing data using SHA-3 (Keccak)...")
         sha3_256 = hashlib.sha3_256()
         sha3_256.update(data.encode('utf-8'))
         digest = sha3_256.hexdigest()
-        print(f"[QuantumTools] Hash generated: {digest}")
+        logger.debug("[QuantumTools] Hash generated: %s", digest)
         return digest
 
+    def hash_quantum_safe_many(self, messages):
+        """
+        Hash many independent messages with SHA-3 (Keccak) in one call.
+
+        :param messages: Iterable of str or bytes messages.
+        :return: A list of hex digests, in the same order as the messages.
+        """
+        sha3_256 = hashlib.sha3_256
+        digests = [
+            sha3_256(message if isinstance(message, bytes) else message.encode('utf-8')).hexdigest()
+            for message in messages
+        ]
+        logger.debug("[QuantumTools] Hashed %s messages using SHA-3 (Keccak).", len(digests))
+        return digests
+
+    def _hash_message(self, message):
+        """
+        Domain-separated SHA-3 digest of a message, as raw bytes, for Falcon signing and verification.
+        """
+        # Copying the prefixed state skips re-initializing and re-absorbing the domain tag per message
+        sha3_256 = self._sha3_base.copy()
+        sha3_256.update(message if isinstance(message, bytes) else message.encode('utf-8'))
+        return sha3_256.digest()
+
     def generate_falcon_signature(self, message, private_key):
         """
         Generate a digital signature using the Falcon algorithm (a lattice-based signature scheme).
@@ -72,10 +107,10 @@ class QuantumTools:
         :param private_key: The private key for signing.
         :return: A digital signature.
         """
-        print("[QuantumTools] Generating Falcon signature...")
-        hashed_message = self.hash_quantum_safe(message)
+        logger.debug("[QuantumTools] Generating Falcon signature...")
+        hashed_message = self._hash_message(message)
         signature = self.lattice_crypto.sign_falcon(hashed_message, private_key)
-        print("[QuantumTools] Signature generated.")
+        logger.debug("[QuantumTools] Signature generated.")
         return signature
 
     def verify_falcon_signature(self, message, signature, public_key):
@@ -87,13 +122,13 @@ class QuantumTools:
         :param public_key: The public key for verification.
         :return: True if signature is valid, False otherwise.
         """
-        print("[QuantumTools] Verifying Falcon signature...")
-        hashed_message = self.hash_quantum_safe(message)
+        logger.debug("[QuantumTools] Verifying Falcon signature...")
+        hashed_message = self._hash_message(message)
         is_valid = self.lattice_crypto.verify_falcon(hashed_message, signature, public_key)
         if is_valid:
-            print("[QuantumTools] Signature verified successfully.")
+            logger.debug("[QuantumTools] Signature verified successfully.")
         else:
-            print("[QuantumTools] Signature verification failed.")
+            logger.debug("[QuantumTools] Signature verification failed.")
         return is_valid
 
     def random_oracle(self, input_data, length=32):
@@ -104,13 +139,14 @@ class QuantumTools:
         :param length: Length of the output in bytes (default: 32).
         :return: A pseudo-random byte string.
         """
-        print("[QuantumTools] Generating random oracle output...")
-        keccak = hashlib.sha3_512()
-        keccak.update(input_data.encode('utf-8'))
-        digest = keccak.digest()
+        logger.debug("[QuantumTools] Generating random oracle output...")
+        # SHAKE-256 is the Keccak XOF, so the digest always spans the full requested length
+        digest = hashlib.shake_256(input_data.encode('utf-8')).digest(length)
         random_bytes = secrets.token_bytes(length)
-        combined_result = bytes([_a ^ _b for _a, _b in zip(digest, random_bytes)])
-        print(f"[QuantumTools] Random oracle output generated: {combined_result.hex()}")
+        # XOR the two buffers as single integers rather than byte by byte
+        combined_result = (int.from_bytes(digest, 'big') ^ int.from_bytes(random_bytes, 'big')).to_bytes(length, 'big')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[QuantumTools] Random oracle output generated: %s", combined_result.hex())
         return combined_result
 
     def grover_attack_simulation(self, oracle_function, target_output, iterations):
@@ -122,14 +158,20 @@ class QuantumTools:
         :param iterations: Number of attempts for the simulation.
         :return: The preimage if found, else None.
         """
-        print("[QuantumTools] Simulating Grover's attack (conceptual)...")
-        for _ in range(iterations):
-            input_candidate = secrets.token_hex(16)
-            oracle_result = oracle_function(input_candidate)
-            if oracle_result == target_output:
-                print(f"[QuantumTools] Grover's simulation successful: Preimage found - {input_candidate}")
-                return input_candidate
-        print("[QuantumTools] Grover's simulation did not find a match.")
+        logger.debug("[QuantumTools] Simulating Grover's attack (conceptual)...")
+        # Candidates come from a userspace AES-CTR keystream keyed once from the OS, a batch at a time,
+        # and are hex-encoded in one pass instead of a token_hex(16) syscall per iteration
+        keystream = AES.new(secrets.token_bytes(16), AES.MODE_CTR, nonce=b'').encrypt
+        zeros = bytes(16 * GROVER_BATCH_SIZE)
+        for batch_start in range(0, iterations, GROVER_BATCH_SIZE):
+            batch_size = min(GROVER_BATCH_SIZE, iterations - batch_start)
+            candidates = keystream(zeros[:16 * batch_size]).hex()
+            for offset in range(0, 32 * batch_size, 32):
+                input_candidate = candidates[offset:offset + 32]
+                if oracle_function(input_candidate) == target_output:
+                    logger.debug("[QuantumTools] Grover's simulation successful: Preimage found - %s", input_candidate)
+                    return input_candidate
+        logger.debug("[QuantumTools] Grover's simulation did not find a match.")
         return None
 
     def simulate_quantum_entanglement_key_exchange(self):
@@ -138,14 +180,15 @@ class QuantumTools:
         
         :return: A shared quantum-secure key.
         """
-        print("[QuantumTools] Simulating quantum entanglement-based key exchange...")
+        logger.debug("[QuantumTools] Simulating quantum entanglement-based key exchange...")
         shared_key = secrets.token_hex(32)
-        print(f"[QuantumTools] Quantum entangled key generated: {shared_key}")
+        logger.debug("[QuantumTools] Quantum entangled key generated: %s", shared_key)
         return shared_key
 
 
 # Example usage of QuantumTools for SypherCore
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
     qt = QuantumTools()
 
     # Generate a quantum-secure keypair
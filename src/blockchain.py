@@ -1,8 +1,14 @@
 import hashlib
-import json
+import itertools
+import struct
 import time
+from concurrent.futures import ProcessPoolExecutor
 from transaction import Transaction
 
+# index, hash, previous hash, timestamp, nonce, transaction count
+_BLOCK_HEADER = struct.Struct('<Q32s32sdQI')
+_CHAIN_LENGTH = struct.Struct('<I')
+
 class Block:
     def __init__(self, index, transactions, previous_hash, timestamp=None, nonce=0):
         self.index = index
@@ -10,51 +16,217 @@ class Block:
         self.previous_hash = previous_hash
         self.timestamp = timestamp or time.time()
         self.nonce = nonce
+        # Merkle root over the transaction hashes, computed once; the header commits to it instead of the list
+        self.txroot = merkle_root(transactions)
         self.hash = self.compute_hash()
 
+    @property
+    def hash_hex(self):
+        return self.hash.hex()
+
+    def header_prefix(self):
+        """
+        Serialize everything except the nonce into a fixed binary layout:
+        index (u64) || previous hash (32 bytes) || timestamp (f64) || transaction root (32 bytes).
+        """
+        return struct.pack('<Q32sd32s', self.index, self.previous_hash, self.timestamp, self.txroot)
+
     def compute_hash(self):
-        block_string = json.dumps(self.__dict__, sort_keys=True)
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        block_hash = hashlib.sha256(self.header_prefix())
+        block_hash.update(self.nonce.to_bytes(8, 'little'))
+        return block_hash.digest()
+
+    def to_bytes(self):
+        """
+        Pack the block as a fixed-width header followed by its transaction records.
+        """
+        header = _BLOCK_HEADER.pack(self.index, self.hash, self.previous_hash,
+                                    self.timestamp, self.nonce, len(self.transactions))
+        return header + b''.join(transaction.to_bytes() for transaction in self.transactions)
+
+    @classmethod
+    def unpack_from(cls, buffer, offset=0):
+        """
+        Read one block written by to_bytes. The transmitted hash is kept as-is so validation can check it.
+
+        :return: A tuple (block, offset just past the record).
+        """
+        index, block_hash, previous_hash, timestamp, nonce, count = _BLOCK_HEADER.unpack_from(buffer, offset)
+        offset += _BLOCK_HEADER.size
+        transactions = []
+        for _ in range(count):
+            transaction, offset = Transaction.unpack_from(buffer, offset)
+            transactions.append(transaction)
+        block = cls(index, transactions, previous_hash, timestamp, nonce)
+        block.hash = block_hash
+        return block, offset
+
+
+# Nonces scanned per sha256_mine call
+MINING_BATCH_SIZE = 1024
+
+# Nonces scanned per worker task when mining across processes
+PARALLEL_MINING_BATCH_SIZE = 65536
+
+_pack_nonce = struct.Struct('<Q').pack
+
+
+def sha256_mine(prefix_hash, start_nonce, batch, target):
+    """
+    Scan nonces [start_nonce, start_nonce + batch) for a digest at or below target.
+
+    :param prefix_hash: SHA-256 object that has already absorbed the block header prefix.
+    :param start_nonce: First nonce to try.
+    :param batch: Number of nonces to try.
+    :param target: 32-byte big-endian bound; equal-length bytes compare like the integers they encode.
+    :return: (nonce, digest) for the first hit, or None if the range has none.
+    """
+    copy = prefix_hash.copy
+    for nonce in range(start_nonce, start_nonce + batch):
+        attempt = copy()
+        attempt.update(_pack_nonce(nonce))
+        digest = attempt.digest()
+        if digest <= target:
+            return nonce, digest
+    return None
+
+
+def _mine_range(prefix, start_nonce, batch, target):
+    # Process-pool entry point: hash objects cannot be pickled, so each task rebuilds the prefix state once
+    return sha256_mine(hashlib.sha256(prefix), start_nonce, batch, target)
+
+
+def merkle_root(transactions, rehash=False):
+    """
+    Pairwise SHA-256 merkle root over the transaction hashes; an odd node is paired with itself.
+
+    :param rehash: Hash every transaction from its current fields instead of using its cached digest,
+                   so a transaction edited after it was hashed changes the root.
+    """
+    if rehash:
+        level = [transaction.compute_hash() for transaction in transactions]
+    else:
+        level = [transaction.digest for transaction in transactions]
+    if not level:
+        return bytes(32)
+    sha256 = hashlib.sha256
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        # Nodes on one level are independent; pair them off a shared iterator instead of indexing
+        pairs = iter(level)
+        level = [sha256(left + right).digest() for left, right in zip(pairs, pairs)]
+    return level[0]
 
 class Blockchain:
     difficulty = 4
+    # Worker processes for proof_of_work; 1 mines in-process, which is cheaper at low difficulty
+    mining_workers = 1
 
     def __init__(self):
         self.chain = []
-        self.pending_transactions = []
+        # Keyed by transaction digest: O(1) membership, and re-adding the same Transaction (or a decoded copy) is a no-op.
+        # Separately created payments never collide, since each carries its own random nonce
+        self.pending_transactions = {}
         self.create_genesis_block()
 
     def create_genesis_block(self):
-        genesis_block = Block(0, [], "0")
+        genesis_block = Block(0, [], bytes(32))
         genesis_block.hash = genesis_block.compute_hash()
         self.chain.append(genesis_block)
 
     def add_transaction(self, transaction):
-        self.pending_transactions.append(transaction)
+        self.pending_transactions.setdefault(transaction.digest, transaction)
 
     def mine_pending_transactions(self, miner_address):
         new_block = Block(
             index=len(self.chain),
-            transactions=self.pending_transactions,
+            transactions=list(self.pending_transactions.values()),
             previous_hash=self.chain[-1].hash
         )
 
         new_block = self.proof_of_work(new_block)
         self.chain.append(new_block)
-        self.pending_transactions = [Transaction("network", miner_address, 1)]
+        reward = Transaction("network", miner_address, 1)
+        self.pending_transactions = {reward.digest: reward}
 
     def proof_of_work(self, block):
-        while not block.hash.startswith('0' * Blockchain.difficulty):
-            block.nonce += 1
-            block.hash = block.compute_hash()
+        # Hash the header once; each attempt only copies that state and feeds the 8-byte nonce
+        prefix_hash = hashlib.sha256(block.header_prefix())
+        # `difficulty` leading zero hex digits <=> the big-endian digest is at most this bound
+        target = ((1 << (256 - 4 * Blockchain.difficulty)) - 1).to_bytes(32, 'big')
+        digest = block.hash
+        nonce = block.nonce
+        if digest > target and Blockchain.mining_workers > 1:
+            nonce, digest = self._mine_parallel(block.header_prefix(), nonce + 1, target)
+        while digest > target:
+            found = sha256_mine(prefix_hash, nonce + 1, MINING_BATCH_SIZE, target)
+            if found is None:
+                nonce += MINING_BATCH_SIZE
+            else:
+                nonce, digest = found
+        block.nonce = nonce
+        block.hash = digest
         return block
 
+    @staticmethod
+    def _mine_parallel(prefix, start_nonce, target):
+        """
+        Search consecutive nonce ranges across worker processes, one range per worker per round.
+
+        :return: (nonce, digest) for the lowest winning nonce.
+        """
+        workers = Blockchain.mining_workers
+        stride = workers * PARALLEL_MINING_BATCH_SIZE
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            while True:
+                starts = range(start_nonce, start_nonce + stride, PARALLEL_MINING_BATCH_SIZE)
+                # map yields in submission order, so the first hit is also the lowest nonce of the round
+                for found in executor.map(_mine_range, itertools.repeat(prefix), starts,
+                                          itertools.repeat(PARALLEL_MINING_BATCH_SIZE), itertools.repeat(target)):
+                    if found is not None:
+                        return found
+                start_nonce += stride
+
+    def serialize_chain(self):
+        """
+        Encode the chain in the binary wire format: a block count followed by packed blocks.
+        """
+        return _CHAIN_LENGTH.pack(len(self.chain)) + b''.join(block.to_bytes() for block in self.chain)
+
+    @staticmethod
+    def deserialize_chain(payload):
+        """
+        Decode a chain produced by serialize_chain.
+
+        :return: A list of blocks.
+        """
+        (count,) = _CHAIN_LENGTH.unpack_from(payload, 0)
+        offset = _CHAIN_LENGTH.size
+        chain = []
+        for _ in range(count):
+            block, offset = Block.unpack_from(payload, offset)
+            chain.append(block)
+        return chain
+
     def is_chain_valid(self):
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i - 1]
+        return Blockchain.validate_chain(self.chain)
+
+    @staticmethod
+    def validate_chain(chain):
+        """
+        Check hash links, block hashes and transaction roots of any list of blocks, stopping at the first failure.
+        """
+        if len(chain) < 2:
+            return True
+        # Check every hash link, which is cheap, before any re-hashing. Links are compared pairwise:
+        # concatenated columns would match when a length change in one block is offset by its neighbour
+        if not all(block.previous_hash == previous_block.hash for previous_block, block in zip(chain, chain[1:])):
+            return False
+        for current_block in chain[1:]:
             if current_block.hash != current_block.compute_hash():
                 return False
-            if current_block.previous_hash != previous_block.hash:
+            # Cached digests would hide a transaction edited after mining, so re-hash from the fields
+            if current_block.txroot != merkle_root(current_block.transactions, rehash=True):
                 return False
         return True
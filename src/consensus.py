@@ -20,6 +20,4 @@ class Consensus:
         return False
 
     def is_chain_valid(self, chain):
-        blockchain = Blockchain()
-        blockchain.chain = chain
-        return blockchain.is_chain_valid()
+        return Blockchain.validate_chain(chain)
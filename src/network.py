@@ -1,28 +1,61 @@
 import requests
+import struct
+from blockchain import Blockchain
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Upper bound on requests in flight to peers at once
+MAX_PARALLEL_REQUESTS = 32
+
+# (connect, read) seconds; a dead peer must not hold up a broadcast
+REQUEST_TIMEOUT = (1, 5)
+
+_FAILED = object()
 
 class Network:
     def __init__(self):
         self.nodes = set()
+        # Keep-alive session: repeat broadcasts reuse pooled connections instead of reconnecting to every peer
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=Retry(total=2, backoff_factor=0.1)))
 
     def register_node(self, node_address):
         self.nodes.add(node_address)
 
+    def _fan_out(self, request):
+        # Contact every node concurrently so the total wait is the slowest peer, not the sum of all of them
+        nodes = list(self.nodes)
+        if not nodes:
+            return []
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_REQUESTS, len(nodes))) as executor:
+            return list(executor.map(request, nodes))
+
     def broadcast(self, action, data):
-        for node in self.nodes:
+        def post(node):
             url = f"http://{node}/{action}"
             try:
-                requests.post(url, json=data)
+                if isinstance(data, bytes):
+                    self.session.post(url, data=data, headers={'Content-Type': 'application/octet-stream'}, timeout=REQUEST_TIMEOUT)
+                else:
+                    self.session.post(url, json=data, timeout=REQUEST_TIMEOUT)
             except requests.RequestException as e:
                 print(f"Failed to contact node {node}: {e}")
 
+        self._fan_out(post)
+
     def get_chains(self):
-        chains = []
-        for node in self.nodes:
+        def fetch(node):
             url = f"http://{node}/get_chain"
             try:
-                response = requests.get(url)
-                chain = response.json()
-                chains.append(chain)
+                response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+                # Peers exchange chains in the binary format written by Blockchain.serialize_chain
+                return Blockchain.deserialize_chain(response.content)
             except requests.RequestException as e:
                 print(f"Failed to get chain from node {node}: {e}")
-        return chains
+                return _FAILED
+            except (struct.error, UnicodeDecodeError) as e:
+                print(f"Malformed chain from node {node}: {e}")
+                return _FAILED
+
+        return [chain for chain in self._fan_out(fetch) if chain is not _FAILED]
@@ -17,7 +17,7 @@ class Node:
         self.broadcast_chain()
 
     def broadcast_chain(self):
-        self.network.broadcast("chain_update", self.blockchain.chain)
+        self.network.broadcast("chain_update", self.blockchain.serialize_chain())
 
     def resolve_conflicts(self):
         other_chains = self.network.get_chains()
@@ -1,25 +1,56 @@
+import random
+
+
 class Staking:
     def __init__(self):
         self.stakeholders = {}
+        self._total = 0
+        # Walker alias table over the stakeholders, rebuilt lazily after stakes change
+        self._addrs = []
+        self._prob = []
+        self._alias = []
+        self._dirty = True
 
     def add_stake(self, address, amount):
         if address in self.stakeholders:
             self.stakeholders[address] += amount
         else:
             self.stakeholders[address] = amount
+        self._total += amount
+        self._dirty = True
 
     def get_stake(self, address):
         return self.stakeholders.get(address, 0)
 
+    def _build_alias_table(self):
+        # Vose's construction: O(N) once, then each selection is a single O(1) draw
+        addrs = list(self.stakeholders)
+        count = len(addrs)
+        total = self._total
+        if total > 0:
+            scaled = [self.stakeholders[address] * count / total for address in addrs]
+        else:
+            scaled = [1.0] * count
+        prob = [1.0] * count
+        alias = list(range(count))
+        small = [i for i, weight in enumerate(scaled) if weight < 1.0]
+        large = [i for i, weight in enumerate(scaled) if weight >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left over is 1.0 up to rounding error and keeps its own column
+        self._addrs, self._prob, self._alias = addrs, prob, alias
+        self._dirty = False
+
     def select_validator(self):
         if not self.stakeholders:
             return None
+        if self._dirty:
+            self._build_alias_table()
 
-        total_stake = sum(self.stakeholders.values())
-        choice = random.uniform(0, total_stake)
-
-        current = 0
-        for address, stake in self.stakeholders.items():
-            current += stake
-            if current >= choice:
-                return address
+        i = random.randrange(len(self._addrs))
+        return self._addrs[i] if random.random() < self._prob[i] else self._addrs[self._alias[i]]
@@ -1,15 +1,86 @@
 import hashlib
+import secrets
+import struct
+
+# nonce, sender length, recipient length, amount type tag ('q' int / 'd' float)
+_TX_HEADER = struct.Struct('<QHHc')
+
+# Largest encoded sender or recipient the u16 length prefix can describe
+_MAX_FIELD_BYTES = 0xFFFF
+# Integer amounts are packed as signed 64-bit
+_MIN_AMOUNT, _MAX_AMOUNT = -2 ** 63, 2 ** 63 - 1
 
 class Transaction:
-    def __init__(self, sender, recipient, amount):
+    __slots__ = ('sender', 'recipient', 'amount', 'nonce', '_digest')
+
+    def __init__(self, sender, recipient, amount, nonce=None):
+        # Reject anything the binary record cannot encode here, rather than when the digest is first taken
+        for field, value in (('sender', sender), ('recipient', recipient)):
+            if not isinstance(value, str):
+                raise TypeError(f"Transaction {field} must be a str, got {type(value).__name__}")
+            if len(value.encode('utf-8')) > _MAX_FIELD_BYTES:
+                raise ValueError(f"Transaction {field} exceeds {_MAX_FIELD_BYTES} bytes")
+        if isinstance(amount, bool) or not isinstance(amount, (int, float)):
+            raise TypeError(f"Transaction amount must be an int or float, got {type(amount).__name__}")
+        if isinstance(amount, int) and not _MIN_AMOUNT <= amount <= _MAX_AMOUNT:
+            raise ValueError(f"Transaction amount {amount} does not fit in a signed 64-bit integer")
         self.sender = sender
         self.recipient = recipient
         self.amount = amount
-        self.hash = self.compute_hash()
+        # Random per transaction, so two otherwise identical payments hash (and deduplicate) separately
+        self.nonce = secrets.randbits(64) if nonce is None else nonce
+        self._digest = None
 
     def compute_hash(self):
-        transaction_string = f"{self.sender}{self.recipient}{self.amount}"
-        return hashlib.sha256(transaction_string.encode()).hexdigest()
+        # The length-prefixed binary record is unambiguous, unlike concatenating the fields as text
+        return hashlib.sha256(self.to_bytes()).digest()
+
+    @property
+    def digest(self):
+        # Hashed lazily on first use and kept as the raw 32 bytes. Chain validation re-hashes from the
+        # fields instead, so a transaction edited after it was hashed is still caught
+        if self._digest is None:
+            self._digest = self.compute_hash()
+        return self._digest
+
+    @property
+    def hash(self):
+        return self.digest.hex()
+
+    def __eq__(self, other):
+        if not isinstance(other, Transaction):
+            return NotImplemented
+        return self.digest == other.digest
+
+    def __hash__(self):
+        return hash(self.digest)
+
+    def to_bytes(self):
+        """
+        Pack the transaction as a length-prefixed binary record.
+        """
+        sender = self.sender.encode('utf-8')
+        recipient = self.recipient.encode('utf-8')
+        # Keep int vs float so the amount, and with it the hash, survives a round trip unchanged
+        amount_type = b'd' if isinstance(self.amount, float) else b'q'
+        return (_TX_HEADER.pack(self.nonce, len(sender), len(recipient), amount_type) + sender + recipient
+                + struct.pack('<' + amount_type.decode(), self.amount))
+
+    @classmethod
+    def unpack_from(cls, buffer, offset=0):
+        """
+        Read one transaction written by to_bytes.
+
+        :return: A tuple (transaction, offset just past the record).
+        """
+        nonce, sender_length, recipient_length, amount_type = _TX_HEADER.unpack_from(buffer, offset)
+        offset += _TX_HEADER.size
+        sender = bytes(buffer[offset:offset + sender_length]).decode('utf-8')
+        offset += sender_length
+        recipient = bytes(buffer[offset:offset + recipient_length]).decode('utf-8')
+        offset += recipient_length
+        (amount,) = struct.unpack_from('<' + amount_type.decode(), buffer, offset)
+        return cls(sender, recipient, amount, nonce), offset + 8
 
     def validate(self):
         # Here, you could add logic to verify signatures, etc.
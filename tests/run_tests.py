@@ -0,0 +1,126 @@
+"""
+Run every test module in its own worker process.
+
+The suites share no mutable state, so total wall time approaches that of the slowest module.
+
+Usage: python tests/run_tests.py [--quick] [max_workers]
+
+--quick runs only the lexer and parser tests, so edits to the front end skip importing the
+interpreter, privacy and quantum modules.
+"""
+import importlib
+import importlib.util
+import io
+import os
+import sys
+import traceback
+import types
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+TESTS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+REPOSITORY_ROOT = os.path.dirname(TESTS_DIRECTORY)
+
+# Directories, relative to the repository root, that each test module imports from
+MODULE_PATHS = {
+    "test_blockchain": ("src",),
+    "test_chain_serialization": ("src",),
+    "test_chain_validation": ("src",),
+    "test_staking": ("src",),
+    "test_transaction": ("src",),
+    "test_compiler": ("compiler",),
+    "test_interpreter": ("compiler", "interpreter"),
+    "test_lattice_crypto": ("quantum_resistance",),
+    "test_privacy_contracts": ("contracts", "quantum_resistance"),
+    "test_proof_verification": ("privacy_contracts",),
+    "test_quantum_resistance": ("quantum_resistance",),
+}
+
+# Modules whose "from ast import ASTNode" means compiler/ast.py, mapped to the dependencies
+# that need the stdlib ast and so are imported before compiler/ast.py is swapped in
+SYPHER_AST_MODULES = {
+    "test_compiler": (),
+    "test_interpreter": ("interpreter",),
+}
+
+# Modules and test-name patterns selected by --quick
+QUICK_MODULES = ("test_compiler",)
+QUICK_PATTERNS = ("*lexer*", "*parser*")
+
+
+def _import_with_sypher_ast(module_name, dependencies):
+    """
+    Import a test module while "ast" resolves to compiler/ast.py, then restore the stdlib module.
+    compiler/ is never a plain sys.path entry ahead of the stdlib, so unittest and the interpreter
+    keep the real ast.
+
+    :param module_name: Importable name of the test module.
+    :param dependencies: Modules imported first, against the stdlib ast.
+    """
+    for dependency in dependencies:
+        importlib.import_module(dependency)
+    # With compiler/ on the path its compiler.py would shadow the compiler package, so register the package
+    package = types.ModuleType("compiler")
+    package.__path__ = [os.path.join(REPOSITORY_ROOT, "compiler")]
+    sys.modules.setdefault("compiler", package)
+    spec = importlib.util.spec_from_file_location("ast", os.path.join(REPOSITORY_ROOT, "compiler", "ast.py"))
+    sypher_ast = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(sypher_ast)
+    stdlib_ast = sys.modules["ast"]
+    sys.modules["ast"] = sypher_ast
+    try:
+        importlib.import_module(module_name)
+    finally:
+        sys.modules["ast"] = stdlib_ast
+
+
+def run_module(module_name, patterns=None):
+    """
+    Load and run one test module, capturing the runner's report.
+    Each call runs in a fresh worker, so the sys.path entries added here do not leak between modules.
+
+    :param module_name: Importable name of the test module.
+    :param patterns: Optional fnmatch patterns; only test methods matching one of them are run.
+    :return: A tuple (passed, report).
+    """
+    # Appended, not prepended, so directories such as compiler/ cannot shadow the stdlib
+    sys.path.extend(os.path.join(REPOSITORY_ROOT, directory) for directory in MODULE_PATHS.get(module_name, ()))
+    sys.path.append(TESTS_DIRECTORY)
+    stream = io.StringIO()
+    loader = unittest.TestLoader()
+    loader.testNamePatterns = list(patterns) if patterns else None
+    try:
+        if module_name in SYPHER_AST_MODULES:
+            _import_with_sypher_ast(module_name, SYPHER_AST_MODULES[module_name])
+        suite = loader.loadTestsFromName(module_name)
+    except Exception:
+        # A module that cannot be imported fails on its own instead of aborting the whole run
+        return False, traceback.format_exc()
+    result = unittest.TextTestRunner(stream=stream).run(suite)
+    return result.wasSuccessful(), stream.getvalue()
+
+
+def main(max_workers=None, quick=False):
+    if quick:
+        modules, patterns = list(QUICK_MODULES), QUICK_PATTERNS
+    else:
+        modules = sorted(name[:-3] for name in os.listdir(TESTS_DIRECTORY)
+                         if name.startswith("test_") and name.endswith(".py"))
+        patterns = None
+    passed_all = True
+    # One module per worker process: each module gets its own sys.path and imports
+    with ProcessPoolExecutor(max_workers=max_workers, max_tasks_per_child=1) as executor:
+        # map yields in submission order, so reports print in a stable order
+        for module_name, (passed, report) in zip(modules, executor.map(run_module, modules, [patterns] * len(modules))):
+            print(f"== {module_name}")
+            print(report)
+            passed_all = passed_all and passed
+    return 0 if passed_all else 1
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:]
+    quick = "--quick" in arguments
+    if quick:
+        arguments.remove("--quick")
+    sys.exit(main(int(arguments[0]) if arguments else None, quick=quick))
@@ -0,0 +1,76 @@
+import struct
+import unittest
+from blockchain import Blockchain
+from transaction import Transaction
+
+
+class TestChainSerialization(unittest.TestCase):
+    """
+    Test Suite for the binary chain format exchanged between SypherCore nodes
+    This suite checks that serialize_chain and deserialize_chain round-trip blocks and transactions.
+    """
+
+    def setUp(self):
+        """
+        Mine a short chain at low difficulty so the tests stay fast.
+        """
+        self._difficulty = Blockchain.difficulty
+        Blockchain.difficulty = 1
+        self.blockchain = Blockchain()
+        self.blockchain.add_transaction(Transaction("Alice", "Bob", 10))
+        self.blockchain.add_transaction(Transaction("Carol", "Dave", 2.5))
+        self.blockchain.mine_pending_transactions("Node_1")
+        self.blockchain.mine_pending_transactions("Node_1")
+
+    def tearDown(self):
+        Blockchain.difficulty = self._difficulty
+
+    def test_round_trip_preserves_blocks(self):
+        """
+        Test that every block field survives a serialize/deserialize round trip.
+        """
+        chain = Blockchain.deserialize_chain(self.blockchain.serialize_chain())
+        self.assertEqual(
+            len(chain), len(self.blockchain.chain),
+            "[Round Trip Test] Expected {} blocks but got {}".format(len(self.blockchain.chain), len(chain))
+        )
+        for original, decoded in zip(self.blockchain.chain, chain):
+            self.assertEqual(
+                (decoded.index, decoded.hash, decoded.previous_hash, decoded.timestamp, decoded.nonce, decoded.txroot),
+                (original.index, original.hash, original.previous_hash, original.timestamp, original.nonce, original.txroot),
+                "[Round Trip Test] Block {} changed in transit".format(original.index)
+            )
+
+    def test_round_trip_preserves_transactions(self):
+        """
+        Test that transactions keep their fields, amount types and nonces across a round trip.
+        """
+        chain = Blockchain.deserialize_chain(self.blockchain.serialize_chain())
+        for original, decoded in zip(self.blockchain.chain, chain):
+            self.assertEqual(
+                [(tx.sender, tx.recipient, tx.amount, type(tx.amount), tx.nonce) for tx in decoded.transactions],
+                [(tx.sender, tx.recipient, tx.amount, type(tx.amount), tx.nonce) for tx in original.transactions],
+                "[Round Trip Test] Transactions of block {} changed in transit".format(original.index)
+            )
+
+    def test_deserialized_chain_is_valid(self):
+        """
+        Test that a decoded chain passes validation.
+        """
+        chain = Blockchain.deserialize_chain(self.blockchain.serialize_chain())
+        self.assertTrue(
+            Blockchain.validate_chain(chain),
+            "[Round Trip Test] Expected the deserialized chain to be valid."
+        )
+
+    def test_truncated_payload_is_rejected(self):
+        """
+        Test that a cut-off payload raises instead of decoding a partial chain.
+        """
+        payload = self.blockchain.serialize_chain()
+        with self.assertRaises(struct.error):
+            Blockchain.deserialize_chain(payload[:len(payload) // 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import hashlib
+import unittest
+from blockchain import Blockchain, merkle_root
+from transaction import Transaction
+
+
+def _naive_merkle_root(hashes):
+    """
+    Reference merkle root built level by level with explicit indexing.
+    """
+    if not hashes:
+        return bytes(32)
+    level = list(hashes)
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    return level[0]
+
+
+class TestChainValidation(unittest.TestCase):
+    """
+    Test Suite for SypherCore chain validation
+    This suite checks the merkle root and that validation catches blocks or transactions edited after mining.
+    """
+
+    def setUp(self):
+        """
+        Mine a short chain at low difficulty so the tests stay fast.
+        """
+        self._difficulty = Blockchain.difficulty
+        Blockchain.difficulty = 1
+        self.blockchain = Blockchain()
+        self.blockchain.add_transaction(Transaction("Alice", "Bob", 10))
+        self.blockchain.add_transaction(Transaction("Carol", "Dave", 15))
+        self.blockchain.mine_pending_transactions("Node_1")
+        self.blockchain.add_transaction(Transaction("Bob", "Carol", 5))
+        self.blockchain.mine_pending_transactions("Node_1")
+
+    def tearDown(self):
+        Blockchain.difficulty = self._difficulty
+
+    def test_merkle_root_matches_reference(self):
+        """
+        Test the merkle root against a naive construction for odd and even transaction counts.
+        """
+        for count in range(0, 8):
+            transactions = [Transaction("Alice", "Bob", amount) for amount in range(1, count + 1)]
+            expected = _naive_merkle_root([transaction.compute_hash() for transaction in transactions])
+            self.assertEqual(
+                merkle_root(transactions), expected,
+                "[Merkle Root Test] Root of {} transactions does not match the reference".format(count)
+            )
+
+    def test_untampered_chain_is_valid(self):
+        """
+        Test that a freshly mined chain validates.
+        """
+        self.assertTrue(
+            self.blockchain.is_chain_valid(),
+            "[Tamper Detection Test] Expected the mined chain to be valid."
+        )
+
+    def test_edited_transaction_is_detected(self):
+        """
+        Test that editing a mined transaction in place invalidates the chain, even though its digest was cached.
+        """
+        transaction = self.blockchain.chain[1].transactions[0]
+        transaction.digest
+        transaction.amount = 1000
+        self.assertFalse(
+            self.blockchain.is_chain_valid(),
+            "[Tamper Detection Test] Expected the chain to be invalid after editing a transaction."
+        )
+
+    def test_edited_transaction_is_detected_after_round_trip(self):
+        """
+        Test that a chain edited before it is sent still fails validation on the receiving side.
+        """
+        self.blockchain.chain[1].transactions[0].amount = 1000
+        chain = Blockchain.deserialize_chain(self.blockchain.serialize_chain())
+        self.assertFalse(
+            Blockchain.validate_chain(chain),
+            "[Tamper Detection Test] Expected the received chain to be invalid after editing a transaction."
+        )
+
+    def test_broken_hash_link_is_detected(self):
+        """
+        Test that a block pointing at the wrong predecessor invalidates the chain.
+        """
+        self.blockchain.chain[2].previous_hash = bytes(32)
+        self.assertFalse(
+            self.blockchain.is_chain_valid(),
+            "[Tamper Detection Test] Expected the chain to be invalid after breaking a hash link."
+        )
+
+    def test_shifted_hash_link_is_detected(self):
+        """
+        Test that links are checked block by block, so bytes moved between neighbouring links are caught.
+        """
+        genesis, first, second = self.blockchain.chain
+        first.previous_hash = genesis.hash + first.hash[:1]
+        second.previous_hash = first.hash[1:]
+        second.hash = second.compute_hash()
+        self.assertFalse(
+            self.blockchain.is_chain_valid(),
+            "[Tamper Detection Test] Expected the chain to be invalid after shifting bytes between hash links."
+        )
+
+    def test_edited_block_header_is_detected(self):
+        """
+        Test that changing a block's nonce without re-mining invalidates the chain.
+        """
+        self.blockchain.chain[1].nonce += 1
+        self.assertFalse(
+            self.blockchain.is_chain_valid(),
+            "[Tamper Detection Test] Expected the chain to be invalid after editing a block header."
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,19 +4,53 @@ from parser import Parser
 from ast import ASTNode
 from compiler.compiler import Compiler
 
+# Expected bytecode is built once at import rather than inside every test run
+_EXPECTED_BASIC_BYTECODE = (
+    ('PUSH', 42),
+    ('STORE', 'x')
+)
+
+_EXPECTED_FUNCTION_BYTECODE = (
+    ('FUNC_DEF', 'square', ['num']),
+    ('PUSH', 'num'),
+    ('PUSH', 'num'),
+    ('MUL', None),
+    ('RETURN', None)
+)
+
+_EXPECTED_PRIVACY_CONTRACT_BYTECODE = (
+    ('FUNC_DEF', 'privacyContract', ['data']),
+    ('PUSH', 'data'),
+    ('CALL', 'encrypt'),
+    ('STORE', 'encrypted'),
+    ('PUSH', 'encrypted'),
+    ('CALL', 'prove_privacy')
+)
+
+_EXPECTED_PARALLEL_BYTECODE = (
+    ('EXEC_PARALLEL', ['task1', 'task2', 'task3']),
+)
+
+_EXPECTED_ZKP_BYTECODE = (
+    ('PUSH', 'data'),
+    ('CALL', 'prove_privacy')
+)
+
+
 class TestSypherLangCompiler(unittest.TestCase):
     """
     Test Suite for SypherLang Compiler
     This suite will test the lexer, parser, and compiler functionality in SypherLang.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up the lexer, parser, and compiler instances for testing.
+        Build the lexer, parser, and compiler once for the suite; none of them keeps state between tests.
         """
-        self.lexer = Lexer()
-        self.parser = Parser()
-        self.compiler = Compiler()
+        cls.lexer = Lexer()
+        cls.parser = Parser()
+        cls.compiler = Compiler()
 
     def test_lexer_basic_tokens(self):
         """
@@ -24,13 +58,13 @@ class TestSypherLangCompiler(unittest.TestCase):
         """
         code = 'let x = 10;'
         tokens = self.lexer.tokenize(code)
-        expected_tokens = [
+        expected_tokens = (
             ('KEYWORD', 'let'),
             ('IDENTIFIER', 'x'),
             ('OPERATOR', '='),
             ('NUMBER', '10'),
             ('DELIMITER', ';')
-        ]
+        )
         self.assertEqual(tokens, expected_tokens, f"[Lexer Test] Expected tokens {expected_tokens} but got {tokens}")
 
     def test_lexer_advanced_tokens(self):
@@ -39,7 +73,7 @@ class TestSypherLangCompiler(unittest.TestCase):
         """
         code = 'function encryptData(data) { let y = data + 5; }'
         tokens = self.lexer.tokenize(code)
-        expected_tokens = [
+        expected_tokens = (
             ('KEYWORD', 'function'),
             ('IDENTIFIER', 'encryptData'),
             ('DELIMITER', '('),
@@ -54,7 +88,7 @@ class TestSypherLangCompiler(unittest.TestCase):
             ('NUMBER', '5'),
             ('DELIMITER', ';'),
             ('DELIMITER', '}')
-        ]
+        )
         self.assertEqual(tokens, expected_tokens, f"[Lexer Test] Expected tokens {expected_tokens} but got {tokens}")
 
     def test_parser_simple_expression(self):
@@ -71,17 +105,17 @@ class TestSypherLangCompiler(unittest.TestCase):
         ast = self.parser.parse(tokens)
         expected_ast = ASTNode(
             type='program',
-            body=[
+            body=(
                 ASTNode(
                     type='assignment',
                     name='x',
                     value=ASTNode(type='literal', value=10)
-                )
-            ]
+                ),
+            )
         )
         self.assertEqual(
-            ast.to_dict(), expected_ast.to_dict(),
-            f"[Parser Test] Expected AST {expected_ast.to_dict()} but got {ast.to_dict()}"
+            ast, expected_ast,
+            f"[Parser Test] Expected AST {expected_ast!r} but got {ast!r}"
         )
 
     def test_parser_function_call(self):
@@ -107,12 +141,12 @@ class TestSypherLangCompiler(unittest.TestCase):
         ast = self.parser.parse(tokens)
         expected_ast = ASTNode(
             type='program',
-            body=[
+            body=(
                 ASTNode(
                     type='function_call',
                     function_name='myFunc',
-                    args=['param1'],
-                    body=[
+                    args=('param1',),
+                    body=(
                         ASTNode(
                             type='assignment',
                             name='result',
@@ -122,14 +156,14 @@ class TestSypherLangCompiler(unittest.TestCase):
                                 right=ASTNode(type='literal', value=2),
                                 operator='*'
                             )
-                        )
-                    ]
-                )
-            ]
+                        ),
+                    )
+                ),
+            )
         )
         self.assertEqual(
-            ast.to_dict(), expected_ast.to_dict(),
-            f"[Parser Test] Expected AST {expected_ast.to_dict()} but got {ast.to_dict()}"
+            ast, expected_ast,
+            f"[Parser Test] Expected AST {expected_ast!r} but got {ast!r}"
         )
 
     def test_compiler_basic_program(self):
@@ -140,13 +174,9 @@ class TestSypherLangCompiler(unittest.TestCase):
         tokens = self.lexer.tokenize(code)
         ast = self.parser.parse(tokens)
         bytecode = self.compiler.compile(ast)
-        expected_bytecode = [
-            ('PUSH', 42),
-            ('STORE', 'x')
-        ]
         self.assertEqual(
-            bytecode, expected_bytecode,
-            f"[Compiler Test] Expected bytecode {expected_bytecode} but got {bytecode}"
+            tuple(bytecode), _EXPECTED_BASIC_BYTECODE,
+            f"[Compiler Test] Expected bytecode {_EXPECTED_BASIC_BYTECODE} but got {bytecode}"
         )
 
     def test_compiler_function(self):
@@ -157,16 +187,9 @@ class TestSypherLangCompiler(unittest.TestCase):
         tokens = self.lexer.tokenize(code)
         ast = self.parser.parse(tokens)
         bytecode = self.compiler.compile(ast)
-        expected_bytecode = [
-            ('FUNC_DEF', 'square', ['num']),
-            ('PUSH', 'num'),
-            ('PUSH', 'num'),
-            ('MUL', None),
-            ('RETURN', None)
-        ]
         self.assertEqual(
-            bytecode, expected_bytecode,
-            f"[Compiler Test] Expected bytecode {expected_bytecode} but got {bytecode}"
+            tuple(bytecode), _EXPECTED_FUNCTION_BYTECODE,
+            f"[Compiler Test] Expected bytecode {_EXPECTED_FUNCTION_BYTECODE} but got {bytecode}"
         )
 
     def test_privacy_contract(self):
@@ -182,17 +205,9 @@ class TestSypherLangCompiler(unittest.TestCase):
         tokens = self.lexer.tokenize(code)
         ast = self.parser.parse(tokens)
         bytecode = self.compiler.compile(ast)
-        expected_bytecode = [
-            ('FUNC_DEF', 'privacyContract', ['data']),
-            ('PUSH', 'data'),
-            ('CALL', 'encrypt'),
-            ('STORE', 'encrypted'),
-            ('PUSH', 'encrypted'),
-            ('CALL', 'prove_privacy')
-        ]
         self.assertEqual(
-            bytecode, expected_bytecode,
-            f"[Privacy Contract Test] Expected bytecode {expected_bytecode} but got {bytecode}"
+            tuple(bytecode), _EXPECTED_PRIVACY_CONTRACT_BYTECODE,
+            f"[Privacy Contract Test] Expected bytecode {_EXPECTED_PRIVACY_CONTRACT_BYTECODE} but got {bytecode}"
         )
 
     def test_concurrent_execution(self):
@@ -203,12 +218,9 @@ class TestSypherLangCompiler(unittest.TestCase):
         tokens = self.lexer.tokenize(code)
         ast = self.parser.parse(tokens)
         bytecode = self.compiler.compile(ast)
-        expected_bytecode = [
-            ('EXEC_PARALLEL', ['task1', 'task2', 'task3'])
-        ]
         self.assertEqual(
-            bytecode, expected_bytecode,
-            f"[Concurrency Test] Expected bytecode {expected_bytecode} but got {bytecode}"
+            tuple(bytecode), _EXPECTED_PARALLEL_BYTECODE,
+            f"[Concurrency Test] Expected bytecode {_EXPECTED_PARALLEL_BYTECODE} but got {bytecode}"
         )
 
     def test_zero_knowledge_proof(self):
@@ -219,13 +231,9 @@ class TestSypherLangCompiler(unittest.TestCase):
         tokens = self.lexer.tokenize(code)
         ast = self.parser.parse(tokens)
         bytecode = self.compiler.compile(ast)
-        expected_bytecode = [
-            ('PUSH', 'data'),
-            ('CALL', 'prove_privacy')
-        ]
         self.assertEqual(
-            bytecode, expected_bytecode,
-            f"[ZKP Test] Expected bytecode {expected_bytecode} but got {bytecode}"
+            tuple(bytecode), _EXPECTED_ZKP_BYTECODE,
+            f"[ZKP Test] Expected bytecode {_EXPECTED_ZKP_BYTECODE} but got {bytecode}"
         )
 
 
@@ -10,12 +10,18 @@ class TestSypherLangInterpreter(unittest.TestCase):
     This suite will test the correct execution of SypherLang code.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Build the stateless lexer and parser once for the suite.
+        """
+        cls.lexer = Lexer()
+        cls.parser = Parser()
+
     def setUp(self):
         """
-        Set up the lexer, parser, and interpreter instances for testing.
+        Give each test a fresh interpreter, since it holds program variables.
         """
-        self.lexer = Lexer()
-        self.parser = Parser()
         self.interpreter = Interpreter()
 
     def test_variable_assignment(self):
@@ -0,0 +1,103 @@
+import unittest
+import numpy as np
+from lattice_crypto import LatticeCrypto
+
+
+def _naive_negacyclic_product(a, b, q):
+    """
+    Schoolbook product in Z_q[x]/(x^n+1): x^n wraps around to -1.
+    """
+    n = len(a)
+    result = [0] * n
+    for i in range(n):
+        for j in range(n):
+            k = i + j
+            if k < n:
+                result[k] += a[i] * b[j]
+            else:
+                result[k - n] -= a[i] * b[j]
+    return [coefficient % q for coefficient in result]
+
+
+class TestLatticeCrypto(unittest.TestCase):
+    """
+    Test Suite for the Ring-LWE primitives in LatticeCrypto
+    This suite checks the NTT multiply against a schoolbook product and the key encapsulation round trip.
+    """
+
+    # (n, q) pairs covering the int32 and int64 coefficient paths
+    PARAMETERS = ((64, 12289), (32, 7681), (16, 8380417))
+
+    def setUp(self):
+        """
+        Seed a local generator so the random polynomials are reproducible.
+        """
+        self.rng = np.random.default_rng(2024)
+
+    def test_ntt_multiply_matches_naive_product(self):
+        """
+        Test that the NTT product equals the schoolbook negacyclic product, including negative inputs.
+        """
+        for n, q in self.PARAMETERS:
+            lattice_crypto = LatticeCrypto(n, q)
+            for _ in range(5):
+                a = self.rng.integers(-q, q, n)
+                b = self.rng.integers(0, q, n)
+                expected = _naive_negacyclic_product([int(x) for x in a], [int(x) for x in b], q)
+                product = [int(x) for x in lattice_crypto._ntt_mul(a, b)]
+                self.assertEqual(
+                    product, expected,
+                    "[NTT Multiply Test] Product differs from the schoolbook result for n={}, q={}".format(n, q)
+                )
+
+    def test_ntt_multiply_wraps_x_to_the_n(self):
+        """
+        Test the defining relation x^(n-1) * x = -1 in the ring.
+        """
+        n, q = 64, 12289
+        lattice_crypto = LatticeCrypto(n, q)
+        x_top = np.zeros(n, dtype=np.int64)
+        x_top[n - 1] = 1
+        x = np.zeros(n, dtype=np.int64)
+        x[1] = 1
+        expected = [q - 1] + [0] * (n - 1)
+        self.assertEqual(
+            [int(c) for c in lattice_crypto._ntt_mul(x_top, x)], expected,
+            "[NTT Multiply Test] Expected x^n to reduce to -1"
+        )
+
+    def test_encapsulation_round_trip(self):
+        """
+        Test that decapsulation recovers the encapsulated shared secret.
+        """
+        lattice_crypto = LatticeCrypto()
+        public_key, private_key = lattice_crypto.generate_keypair()
+        ciphertext, shared_secret = lattice_crypto.encapsulate(public_key)
+        self.assertEqual(
+            lattice_crypto.decapsulate(private_key, ciphertext), shared_secret,
+            "[Encapsulation Test] Decapsulated secret does not match the encapsulated one"
+        )
+
+    def test_decapsulate_many_matches_single(self):
+        """
+        Test that batch decapsulation agrees with decapsulating each ciphertext alone.
+        """
+        lattice_crypto = LatticeCrypto()
+        public_key, private_key = lattice_crypto.generate_keypair()
+        encapsulated = [lattice_crypto.encapsulate(public_key) for _ in range(4)]
+        self.assertEqual(
+            lattice_crypto.decapsulate_many(private_key, [ciphertext for ciphertext, _ in encapsulated]),
+            [shared_secret for _, shared_secret in encapsulated],
+            "[Encapsulation Test] Batch decapsulation disagrees with the encapsulated secrets"
+        )
+
+    def test_rejects_parameters_without_ntt(self):
+        """
+        Test that a modulus with no negacyclic NTT of the requested degree is refused.
+        """
+        with self.assertRaises(ValueError):
+            LatticeCrypto(256, 3329)
+
+
+if __name__ == '__main__':
+    unittest.main()
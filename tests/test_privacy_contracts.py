@@ -9,11 +9,18 @@ class TestPrivacyContracts(unittest.TestCase):
     This suite tests the correct execution and security features of privacy-related contracts.
     """
 
+    # Fixed transaction fields; each test fills in its own data and proof
+    _TX_SKELETON = {
+        "sender": "0xSenderAddress",
+        "receiver": "0xReceiverAddress"
+    }
+
     def setUp(self):
         """
-        Set up PrivacyContract and QuantumCrypto instances for testing.
+        Set up fresh PrivacyContract, QuantumCrypto and ZeroKnowledgeProof instances for each test,
+        so state such as the contract's audit trail never leaks between tests.
         """
-        self.privacy_contract = PrivacyContract()
+        self.privacy_contract = PrivacyContract("TestContract", self._TX_SKELETON["sender"], "Sensitive Data")
         self.quantum_crypto = QuantumCrypto()
         self.zkp = ZeroKnowledgeProof()
 
@@ -160,12 +167,7 @@ class TestPrivacyContracts(unittest.TestCase):
         data = "BlockchainPrivacy"
         encrypted_data = self.privacy_contract.encrypt_data(data)
         proof = self.zkp.prove(encrypted_data)
-        transaction = {
-            "data": encrypted_data,
-            "proof": proof,
-            "sender": "0xSenderAddress",
-            "receiver": "0xReceiverAddress"
-        }
+        transaction = {**self._TX_SKELETON, "data": encrypted_data, "proof": proof}
         # Simulate adding a transaction to the blockchain
         blockchain_result = self.privacy_contract.add_transaction(transaction)
         self.assertEqual(
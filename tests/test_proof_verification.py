@@ -0,0 +1,85 @@
+import unittest
+from Crypto.PublicKey import RSA
+from prove import generate_proof
+from verify import verify_proof, verify_proofs_batch
+
+
+class TestProofVerification(unittest.TestCase):
+    """
+    Test Suite for batch verification of signed privacy proofs
+    This suite checks that verify_proofs_batch agrees with verify_proof proof by proof.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Generate one RSA key pair for the suite; key generation dominates the run time otherwise.
+        """
+        cls.key_pair = RSA.generate(2048)
+        cls.public_key_pem = cls.key_pair.publickey().export_key()
+        cls.private_key_pem = cls.key_pair.export_key()
+
+    def setUp(self):
+        """
+        Sign a fresh set of proofs and tamper with a copy of one of them.
+        """
+        self.proofs = [generate_proof(f"Transaction {i}", self.private_key_pem) for i in range(4)]
+        self.proofs[2] = dict(self.proofs[2], data="Tampered transaction")
+
+    def test_batch_matches_single_verification(self):
+        """
+        Test that each batch result equals verifying that proof on its own.
+        """
+        expected = [verify_proof(proof, self.public_key_pem) for proof in self.proofs]
+        results = verify_proofs_batch(self.proofs, self.public_key_pem)
+        self.assertEqual(
+            results, expected,
+            "[Batch Verification Test] Expected {} but got {}".format(expected, results)
+        )
+        self.assertEqual(
+            results, [True, True, False, True],
+            "[Batch Verification Test] Expected only the tampered proof to fail, but got {}".format(results)
+        )
+
+    def test_batch_accepts_imported_key(self):
+        """
+        Test that an already-imported RsaKey works like its PEM encoding.
+        """
+        results = verify_proofs_batch(self.proofs, self.key_pair.publickey())
+        self.assertEqual(
+            results, [True, True, False, True],
+            "[Batch Verification Test] Expected only the tampered proof to fail, but got {}".format(results)
+        )
+
+    def test_trust_hash_skips_rehashing_data(self):
+        """
+        Test that trust_hash verifies against the recorded hash, so edited data alone does not fail it.
+        """
+        results = verify_proofs_batch(self.proofs, self.public_key_pem, trust_hash=True)
+        self.assertEqual(
+            results, [True, True, True, True],
+            "[Batch Verification Test] Expected every recorded hash to verify, but got {}".format(results)
+        )
+
+    def test_invalid_key_fails_every_proof(self):
+        """
+        Test that an unreadable public key marks every proof as invalid instead of raising.
+        """
+        results = verify_proofs_batch(self.proofs, b"not a key")
+        self.assertEqual(
+            results, [False] * len(self.proofs),
+            "[Batch Verification Test] Expected every proof to fail with an invalid key, but got {}".format(results)
+        )
+
+    def test_empty_batch(self):
+        """
+        Test that an empty batch verifies to an empty list.
+        """
+        self.assertEqual(
+            verify_proofs_batch([], self.public_key_pem), [],
+            "[Batch Verification Test] Expected an empty result for an empty batch."
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import random
+import unittest
+from collections import Counter
+from staking import Staking
+
+# Draws per distribution check; large enough that a 2% tolerance is many standard deviations wide
+_DRAWS = 50000
+
+
+class TestStaking(unittest.TestCase):
+    """
+    Test Suite for SypherCore proof-of-stake validator selection
+    This suite checks that validators are drawn in proportion to their stake.
+    """
+
+    def setUp(self):
+        """
+        Seed the global RNG so selection frequencies are reproducible.
+        """
+        random.seed(1234)
+        self.staking = Staking()
+
+    def _frequencies(self):
+        counts = Counter(self.staking.select_validator() for _ in range(_DRAWS))
+        return {address: count / _DRAWS for address, count in counts.items()}
+
+    def test_no_stakeholders(self):
+        """
+        Test that selection without stakeholders returns None.
+        """
+        self.assertIsNone(
+            self.staking.select_validator(),
+            "[Validator Selection Test] Expected None when nobody has staked."
+        )
+
+    def test_selection_is_weighted_by_stake(self):
+        """
+        Test that each validator is selected with probability proportional to its stake.
+        """
+        stakes = {"Alice": 10, "Bob": 30, "Carol": 60}
+        for address, amount in stakes.items():
+            self.staking.add_stake(address, amount)
+        frequencies = self._frequencies()
+        for address, amount in stakes.items():
+            self.assertAlmostEqual(
+                frequencies.get(address, 0), amount / 100, delta=0.02,
+                msg="[Validator Selection Test] {} selected {:.3f} of the time, expected {:.2f}".format(
+                    address, frequencies.get(address, 0), amount / 100)
+            )
+
+    def test_selection_tracks_stake_changes(self):
+        """
+        Test that adding stake after a selection rebuilds the table with the new weights.
+        """
+        self.staking.add_stake("Alice", 50)
+        self.staking.add_stake("Bob", 50)
+        self.staking.select_validator()
+        self.staking.add_stake("Bob", 200)
+        frequencies = self._frequencies()
+        self.assertAlmostEqual(
+            frequencies.get("Bob", 0), 250 / 300, delta=0.02,
+            msg="[Validator Selection Test] Bob selected {:.3f} of the time, expected {:.3f}".format(
+                frequencies.get("Bob", 0), 250 / 300)
+        )
+
+    def test_zero_stake_is_never_selected(self):
+        """
+        Test that a stakeholder with no stake is never chosen while others hold stake.
+        """
+        self.staking.add_stake("Alice", 0)
+        self.staking.add_stake("Bob", 5)
+        self.assertNotIn(
+            "Alice", self._frequencies(),
+            "[Validator Selection Test] Expected a zero-stake holder never to be selected."
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
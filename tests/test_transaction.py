@@ -0,0 +1,79 @@
+import unittest
+from decimal import Decimal
+from transaction import Transaction
+
+
+class TestTransaction(unittest.TestCase):
+    """
+    Test Suite for SypherCore transactions
+    This suite checks transaction hashing and that unencodable fields are rejected at construction.
+    """
+
+    def test_field_boundaries_do_not_collide(self):
+        """
+        Test that moving characters between sender and recipient changes the hash.
+        """
+        self.assertNotEqual(
+            Transaction("ab", "c", 1, nonce=0).digest, Transaction("a", "bc", 1, nonce=0).digest,
+            "[Transaction Hash Test] Expected different field splits to hash differently."
+        )
+
+    def test_identical_payments_stay_distinct(self):
+        """
+        Test that two separately created, otherwise identical payments are not equal.
+        """
+        self.assertNotEqual(
+            Transaction("Alice", "Bob", 10), Transaction("Alice", "Bob", 10),
+            "[Transaction Hash Test] Expected two separate payments to have distinct hashes."
+        )
+
+    def test_round_trip_keeps_hash(self):
+        """
+        Test that a transaction decoded from its record hashes identically, for int and float amounts.
+        """
+        for amount in (10, 2.5, 2 ** 63 - 1, -2 ** 63):
+            transaction = Transaction("Alice", "Bob", amount)
+            decoded, _ = Transaction.unpack_from(transaction.to_bytes())
+            self.assertEqual(
+                decoded.digest, transaction.digest,
+                "[Transaction Hash Test] Hash changed across a round trip for amount {!r}".format(amount)
+            )
+
+    def test_rejects_non_numeric_amounts(self):
+        """
+        Test that amounts the record cannot encode raise TypeError when the transaction is created.
+        """
+        for amount in ("10", Decimal("10"), None, True):
+            with self.assertRaises(TypeError, msg="[Transaction Input Test] Accepted amount {!r}".format(amount)):
+                Transaction("Alice", "Bob", amount)
+
+    def test_rejects_out_of_range_amounts(self):
+        """
+        Test that integer amounts outside the signed 64-bit range raise ValueError.
+        """
+        for amount in (2 ** 63, -2 ** 63 - 1):
+            with self.assertRaises(ValueError, msg="[Transaction Input Test] Accepted amount {!r}".format(amount)):
+                Transaction("Alice", "Bob", amount)
+
+    def test_rejects_non_string_parties(self):
+        """
+        Test that a sender or recipient that is not a str raises TypeError.
+        """
+        for sender, recipient in ((None, "Bob"), ("Alice", None), (b"Alice", "Bob")):
+            with self.assertRaises(TypeError, msg="[Transaction Input Test] Accepted {!r} -> {!r}".format(sender, recipient)):
+                Transaction(sender, recipient, 10)
+
+    def test_rejects_oversized_parties(self):
+        """
+        Test that a party too long for the 16-bit length prefix raises ValueError.
+        """
+        with self.assertRaises(ValueError, msg="[Transaction Input Test] Accepted a 65536-byte sender"):
+            Transaction("A" * 0x10000, "Bob", 10)
+        self.assertEqual(
+            len(Transaction("A" * 0xFFFF, "Bob", 10).digest), 32,
+            "[Transaction Input Test] Expected a 65535-byte sender to still hash."
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
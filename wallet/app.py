@@ -1,12 +1,23 @@
-from flask import Flask, render_template, request, jsonify
-import json
+from flask import Flask, Response, render_template, request
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 app = Flask(__name__)
 
 # Define the blockchain RPC URL to interact with
 BLOCKCHAIN_RPC_URL = "http://localhost:8545"
 
+# Shared keep-alive session so wallet calls reuse pooled connections to the RPC node
+# instead of opening a fresh TCP connection per request. POSTs are not replayed once sent.
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=Retry(total=2, backoff_factor=0.1)))
+
+
+def _relay(response):
+    # The node already answers with JSON, so its body is forwarded as-is instead of parsed and re-encoded
+    return Response(response.content, status=response.status_code, mimetype='application/json')
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -14,21 +25,23 @@ def index():
 @app.route('/wallet/create', methods=['POST'])
 def create_wallet():
     # Create a new wallet address
-    response = requests.post(f"{BLOCKCHAIN_RPC_URL}/create_wallet")
-    return jsonify(response.json())
+    response = SESSION.post(f"{BLOCKCHAIN_RPC_URL}/create_wallet", timeout=5)
+    return _relay(response)
 
 @app.route('/wallet/balance', methods=['GET'])
 def get_balance():
     # Get balance of a given wallet address
     address = request.args.get('address')
-    response = requests.get(f"{BLOCKCHAIN_RPC_URL}/get_balance?address={address}")
-    return jsonify(response.json())
+    response = SESSION.get(f"{BLOCKCHAIN_RPC_URL}/get_balance", params={"address": address}, timeout=5)
+    return _relay(response)
 
 @app.route('/wallet/transfer', methods=['POST'])
 def transfer():
-    data = request.json
-    response = requests.post(f"{BLOCKCHAIN_RPC_URL}/transfer", json=data)
-    return jsonify(response.json())
+    # Forward the client's JSON body untouched rather than decoding and re-encoding it
+    response = SESSION.post(f"{BLOCKCHAIN_RPC_URL}/transfer", data=request.get_data(),
+                            headers={'Content-Type': 'application/json'}, timeout=5)
+    return _relay(response)
 
 if __name__ == '__main__':
+    # Development server only; serve wsgi:application with gunicorn in production
     app.run(host='0.0.0.0', port=8080)
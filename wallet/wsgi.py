@@ -0,0 +1,6 @@
+# Production entry point for the wallet. Run it under a threaded WSGI server, e.g.:
+#   gunicorn --chdir wallet -w 4 -k gthread --threads 8 -b 0.0.0.0:8080 wsgi:application
+# Each worker thread proxies a request concurrently and shares the pooled RPC session.
+from app import app
+
+application = app